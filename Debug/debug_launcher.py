@@ -1,30 +1,35 @@
 ﻿import sys
 import os
 
-current_script_dir = os.path.dirname(os.path.abspath(__file__))
+# Fast path: the Fuzzer resolves 'dest' once and forwards it, so no probing is needed
+dest_folder_path = os.environ.get("FUZZ_DEST_PATH")
 
-# Strategy A: Assume I am currently in the root directory (Case when running via Fuzzer)
-path_strategy_a = os.path.join(current_script_dir, "dest")
+if dest_folder_path:
+    print(f"📍 [Path Detection] Using dest folder provided by Fuzzer: {dest_folder_path}")
+else:
+    current_script_dir = os.path.dirname(os.path.abspath(__file__))
 
-# Strategy B: Assume I am currently in the Debug subfolder (Case when running manually)
-path_strategy_b = os.path.join(os.path.dirname(current_script_dir), "dest")
-dest_folder_path = None
+    # Strategy A: Assume I am currently in the root directory (Case when running via Fuzzer)
+    path_strategy_a = os.path.join(current_script_dir, "dest")
 
-if os.path.exists(path_strategy_a):
-    print(f"📍 [Path Detection] Detected running in project root directory (Fuzzer mode)")
-    dest_folder_path = path_strategy_a
-elif os.path.exists(path_strategy_b):
-    print(f"📍 [Path Detection] Detected running in Debug subdirectory (Manual mode)")
-    dest_folder_path = path_strategy_b
-else:
-    # --- If neither is found, print detailed debugging information ---
-    print("="*40)
-    print("❌ Critical Error: 'dest' folder not found!")
-    print(f"   Current location: {current_script_dir}")
-    print(f"   Attempted Path A: {path_strategy_a}")
-    print(f"   Attempted Path B: {path_strategy_b}")
-    print("="*40)
-    sys.exit(1) # Return error code 1
+    # Strategy B: Assume I am currently in the Debug subfolder (Case when running manually)
+    path_strategy_b = os.path.join(os.path.dirname(current_script_dir), "dest")
+
+    if os.path.exists(path_strategy_a):
+        print(f"📍 [Path Detection] Detected running in project root directory (Fuzzer mode)")
+        dest_folder_path = path_strategy_a
+    elif os.path.exists(path_strategy_b):
+        print(f"📍 [Path Detection] Detected running in Debug subdirectory (Manual mode)")
+        dest_folder_path = path_strategy_b
+    else:
+        # --- If neither is found, print detailed debugging information ---
+        print("="*40)
+        print("❌ Critical Error: 'dest' folder not found!")
+        print(f"   Current location: {current_script_dir}")
+        print(f"   Attempted Path A: {path_strategy_a}")
+        print(f"   Attempted Path B: {path_strategy_b}")
+        print("="*40)
+        sys.exit(1) # Return error code 1
 
 # Add 'dest' to the system search path
 if dest_folder_path not in sys.path:
@@ -2,12 +2,52 @@ import sys
 import subprocess
 import os
 import time
+import json
+import py_compile
+import re
+import hashlib
 from google.genai import types                      #type:ignore
 
 # Import modules
 # Ensure Project.toolbox.config contains the 'client' object we defined earlier
 from toolbox.config import client, MODEL_SMART, safety_settings
-from toolbox.tools import code_to_py, clean_code, safe_generate_content
+from toolbox.tools import code_to_py, clean_code, safe_generate_content, safe_generate_text_stream
+
+# Built once and reused by every Tester / Programmer request in error_solving
+DEBUG_GEN_CONFIG = types.GenerateContentConfig(safety_settings = safety_settings)
+
+RUN_TIMEOUT_SEC = 10     # Testing duration
+WORKER_PATH     = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+_WORKER         = None   # Persistent warm interpreter (POSIX only), started on first use
+
+def _get_worker() -> subprocess.Popen:
+    """
+    Returns the persistent debug worker, (re)starting it if it is not alive.
+    """
+    global _WORKER
+    if _WORKER is None or _WORKER.poll() is not None:
+        _WORKER = subprocess.Popen(
+            [sys.executable, WORKER_PATH, str(RUN_TIMEOUT_SEC)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            bufsize=1
+        )
+    return _WORKER
+
+def _run_in_worker(full_path: str) -> dict:
+    """
+    Sends one script to the persistent worker and waits for its JSON report.
+    """
+    worker = _get_worker()
+    worker.stdin.write(os.path.abspath(full_path) + "\n")
+    worker.stdin.flush()
+    reply = worker.stdout.readline()
+    if not reply:
+        raise RuntimeError("debug worker exited unexpectedly")
+    return json.loads(reply)
 
 # Game execution and preliminary debugging (Runtime Check)
 def compile_and_debug(full_path: str) -> dict:
@@ -15,13 +55,51 @@ def compile_and_debug(full_path: str) -> dict:
     filename = os.path.basename(full_path) 
     print(f" Executing and debugging {filename} in folder {folder} ...")
 
+    # Fast path: a SyntaxError does not need an interpreter launch to be reported
+    try:
+        py_compile.compile(full_path, doraise=True)
+    except py_compile.PyCompileError as e:
+        print("Compilation failed. Syntax error found before execution!")
+        return {
+            "state": False,
+            "Text": e.msg
+        }
+
+    # Fast path: reuse a warm interpreter and fork per candidate instead of a cold start
+    if hasattr(os, "fork"):
+        try:
+            outcome = _run_in_worker(full_path)
+            if outcome["returncode"] is None and not outcome["timeout"]:
+                # The worker itself failed (fork / tempfile error), not the game: never report it as a crash
+                raise RuntimeError(outcome["stderr"])
+            if outcome["timeout"]:
+                print("Game continues running (Stable)")
+                return {
+                    "state": True,
+                    "Text": None
+                }
+            elif outcome["returncode"] == 0:
+                print("Game execution finished (Unusual - Main loop should normally be interrupted by timeout)")
+                return {
+                    "state": True,
+                    "Text": None
+                }
+            else:
+                print("Execution failed. Error occurred!")
+                return {
+                    "state": False,
+                    "Text": outcome["stderr"]
+                }
+        except Exception as e:
+            print(f"⚠️ Debug worker unavailable ({e}), falling back to a fresh interpreter")
+
     try:
         result = subprocess.run(
             [sys.executable, filename],
             capture_output=True,
             text=True,
             cwd=folder,
-            timeout=10,               # Testing duration
+            timeout=RUN_TIMEOUT_SEC,
             encoding='utf-8', 
             errors='ignore'           # Ignore undecodable characters
         )
@@ -51,12 +129,83 @@ def compile_and_debug(full_path: str) -> dict:
             "Text": str(e)
         }
 
+TRACE_FRAME_RE   = re.compile(r'File "([^"]+)", line (\d+)')
+SIGNATURE_RE     = re.compile(r'^\s*(class|def)\s+\w+.*$', re.MULTILINE)
+TARGET_FILENAME  = "generated_app.py"   # File name used by code_to_py
+CONTEXT_RADIUS   = 100                  # Lines kept on each side of the crash line
+
+def traceback_code_slice(error_msg: str, code_content: str, radius: int = CONTEXT_RADIUS) -> str:
+    """
+    Reduces the source code sent to the Tester to what the Traceback points at:
+    every class/def signature, plus +-radius lines around the innermost frame in the game file.
+    Falls back to the full source when no usable line number is found.
+    """
+    lines = code_content.split("\n")
+    frame_lines = [
+        int(line_no) for file_name, line_no in TRACE_FRAME_RE.findall(error_msg or "")
+        if os.path.basename(file_name) == TARGET_FILENAME
+    ]
+    if not frame_lines or len(lines) <= 2 * radius:
+        return code_content
+
+    pivot = frame_lines[-1]                 # Innermost frame = crash site
+    start = max(0, pivot - 1 - radius)
+    end = min(len(lines), pivot + radius)
+
+    signatures = "\n".join(match.group(0) for match in SIGNATURE_RE.finditer(code_content))
+    window = "\n".join(lines[start:end])
+    return (
+        f"# --- Class / function signatures ---\n{signatures}\n\n"
+        f"# --- Lines {start + 1}-{end} (crash at line {pivot}) ---\n{window}"
+    )
+
+BASE_DIR          = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIX_CACHE_DIR     = os.environ.get("FUZZ_CACHE_DIR", os.path.join(BASE_DIR, ".fuzz_cache"))
+FIX_CACHE_VERSION = "1"  # Bump whenever the Tester / Programmer prompts change, so old fixes are not replayed
+MAX_CACHED_FIXES  = 256
+_REPLAYED_FIXES   = set()  # Cache entries already tried in this run (replayed or freshly written)
+
+def _fix_cache_path(error_msg: str, code_content: str) -> str:
+    key_material = "||".join((FIX_CACHE_VERSION, MODEL_SMART, error_msg, code_content))
+    key = hashlib.sha1(key_material.encode("utf-8")).hexdigest()
+    return os.path.join(FIX_CACHE_DIR, f"{key}.py")
+
+def _store_fix(cache_path: str, fixed_code: str):
+    """
+    Atomically writes a repaired file into the fix cache, then evicts the oldest entries (FIFO).
+    """
+    try:
+        os.makedirs(FIX_CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(fixed_code)
+        os.replace(tmp_path, cache_path)
+
+        entries = [os.path.join(FIX_CACHE_DIR, name) for name in os.listdir(FIX_CACHE_DIR) if name.endswith(".py")]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for stale_path in entries[MAX_CACHED_FIXES:]:
+            os.remove(stale_path)
+    except OSError as e:
+        print(f"⚠️ Could not cache the repaired code: {e}")
+
 # Multi-Agent Error Solving
 def error_solving(error_msg: str, code_content: str, max_turns: int = 1) -> str:
     """
     Implements the dynamic testing phase from ChatDev.
     A Tester reports the bug, and a Programmer fixes it through a dialogue chain.
     """
+    # Same Traceback on the same source: reuse the fix we already paid an LLM round-trip for.
+    # Only once per run: if the same pair comes back, the cached fix did not work, so ask the model
+    # again and let the new answer replace the entry instead of cycling through the same rewrite.
+    cache_path = _fix_cache_path(error_msg or "", code_content)
+    if cache_path not in _REPLAYED_FIXES and os.path.exists(cache_path):
+        _REPLAYED_FIXES.add(cache_path)
+        print("♻️ [Chat Chain] Identical error seen before, reusing the cached fix")
+        with open(cache_path, "r", encoding="utf-8") as f:
+            current_code = f.read()
+        code_to_py(current_code)
+        return current_code
+
     current_code = code_content
     
     print("🐞 [Chat Chain] Starting Multi-Agent Dynamic Debugging...")
@@ -65,6 +214,8 @@ def error_solving(error_msg: str, code_content: str, max_turns: int = 1) -> str:
         print(f"🔄 Debugging Turn {turn + 1}")
 
         # 1. Tester Agent (Instructor) analyzes the crash
+        # Only the Traceback-relevant slice is needed for diagnosis; the Programmer still gets the full file
+        code_excerpt = traceback_code_slice(error_msg, current_code)
         tester_prompt = (
             "You are a Senior Software Test Engineer (QA).\n"
             "Analyze the following Python Traceback error against the source code.\n"
@@ -76,13 +227,13 @@ def error_solving(error_msg: str, code_content: str, max_turns: int = 1) -> str:
             "4. Missing Groups: If an entity is retrieved from an ObjectPool, check if it was properly added to a Pygame sprite group.\n\n"
             "【YOUR TASK】\n"
             "DO NOT WRITE THE FULL REPAIRED CODE. Just provide the diagnosis and an actionable step-by-step fix plan.\n"
-            f"\n\n【Traceback Error】\n{error_msg}\n\n【Current Source Code】\n{current_code}"
+            f"\n\n【Traceback Error】\n{error_msg}\n\n【Current Source Code】\n{code_excerpt}"
         )
         
         tester_feedback = safe_generate_content(
             model_id = MODEL_SMART,
             contents = tester_prompt,
-            config = types.GenerateContentConfig(safety_settings = safety_settings)
+            config = DEBUG_GEN_CONFIG
         ).text.strip()
         
         print(f"🎯 Tester Diagnosis:\n{tester_feedback}")
@@ -104,11 +255,12 @@ def error_solving(error_msg: str, code_content: str, max_turns: int = 1) -> str:
             "5. DO NOT add any conversational text, pleasantries, or explanations outside the code block."
         )
 
-        programmer_response = safe_generate_content(
+        # The full repaired file is the long answer, stream it instead of waiting for one big response
+        programmer_response = safe_generate_text_stream(
             model_id = MODEL_SMART,
             contents=programmer_prompt,
-            config=types.GenerateContentConfig(safety_settings=safety_settings)
-        ).text
+            config=DEBUG_GEN_CONFIG
+        )
         
         current_code = clean_code(programmer_response)
         
@@ -118,4 +270,6 @@ def error_solving(error_msg: str, code_content: str, max_turns: int = 1) -> str:
 
     # Overwrite and save the repaired file
     code_to_py(current_code) 
+    _store_fix(cache_path, current_code)
+    _REPLAYED_FIXES.add(cache_path)  # Already tried in this run, a repeat of this pair means it failed
     return current_code
\ No newline at end of file
@@ -3,11 +3,274 @@ import sys
 import os
 import threading
 import signal
-from toolbox.config import CHAOS_PAYLOAD
+import random
+import codecs
+import selectors
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Debug._chaos_payload import PAYLOAD as CHAOS_PAYLOAD
 
-def run_fuzz_test(target_path_arg=None):
+FUZZ_TIMEOUT_SEC    = 20
+FUZZ_MAX_WORKERS    = 4            # Default cap: more chaos agents mostly means more Quit clicks, not more coverage
+SUCCESS_MARKER      = b"[FUZZ] SUCCESS"
+STDOUT_TAIL_BYTES   = 4 * 1024     # Only the trailing stdout is ever reported
+STDERR_TAIL_BYTES   = 64 * 1024    # Enough for the final Traceback of a verbose crash
+
+# Encoded once at import instead of on every fuzz run
+CHAOS_PAYLOAD_BYTES  = CHAOS_PAYLOAD.encode("utf-8")
+ORIGINAL_CODE_HEADER = b"\n\n# --- ORIGINAL GAME CODE ---\n"
+
+class _TailBuffer:
+    """
+    Keeps only the last `limit` bytes written to it, so a child that spams
+    output cannot grow the orchestrator's memory without bound.
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.data = bytearray()
+
+    def extend(self, chunk: bytes):
+        self.data.extend(chunk)
+        # Trim lazily (at 2x) so the copy cost stays amortized O(1) per byte
+        if len(self.data) > 2 * self.limit:
+            del self.data[:-self.limit]
+
+    def decode(self, *args, **kwargs) -> str:
+        return bytes(self.data[-self.limit:]).decode(*args, **kwargs)
+
+class _MarkerScanner:
+    """
+    Streaming search for SUCCESS_MARKER: each chunk is scanned once (bytes.find),
+    plus a carry of len(marker) - 1 bytes so markers split across reads are still found.
+    """
+    def __init__(self, marker=SUCCESS_MARKER):
+        self.marker = marker
+        self.carry = b""
+        self.found = False
+
+    def feed(self, chunk: bytes) -> bool:
+        if not self.found:
+            window = self.carry + chunk
+            self.found = window.find(self.marker) != -1
+            self.carry = window[-(len(self.marker) - 1):]
+        return self.found
+
+class _SpawnedProcess:
+    """
+    Minimal Popen look-alike built on os.posix_spawn, which avoids fork()'s
+    page-table copy of a large orchestrator process.
+    posix_spawn has no cwd argument, the payload switches to FUZZ_CWD itself.
+    """
+    def __init__(self, args, env):
+        in_r, in_w = os.pipe()
+        out_r, out_w = os.pipe()
+        err_r, err_w = os.pipe()
+        try:
+            self.pid = os.posix_spawn(args[0], args, env, file_actions=[
+                (os.POSIX_SPAWN_DUP2, in_r, 0),
+                (os.POSIX_SPAWN_DUP2, out_w, 1),
+                (os.POSIX_SPAWN_DUP2, err_w, 2),
+            ])
+        except Exception:
+            for fd in (in_w, out_r, err_r):
+                os.close(fd)
+            raise
+        finally:
+            for fd in (in_r, out_w, err_w):
+                os.close(fd)
+        self.stdin = os.fdopen(in_w, "wb")
+        self.stdout = os.fdopen(out_r, "rb")
+        self.stderr = os.fdopen(err_r, "rb")
+        self.returncode = None
+
+    def poll(self):
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self):
+        if self.returncode is None:
+            _, status = os.waitpid(self.pid, 0)
+            self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def _signal(self, sig):
+        if self.returncode is None:
+            try:
+                os.kill(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def terminate(self):
+        self._signal(signal.SIGTERM)
+
+    def kill(self):
+        self._signal(signal.SIGKILL)
+
+def _launch_worker(args, env, cwd, stdin_bytes):
+    """
+    Starts one fuzz worker with piped stdout/stderr and feeds `stdin_bytes` to it.
+    Uses posix_spawn where available, subprocess.Popen otherwise (Windows).
+    """
+    if hasattr(os, "posix_spawn"):
+        env = dict(env, FUZZ_CWD=cwd)
+        process = _SpawnedProcess(args, env)
+    else:
+        process = subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE, # Critical: Must capture stderr for Tracebacks
+            env=env
+        )
+
+    # `python -` reads the whole script before running it, so this cannot block on our output pipes
+    try:
+        process.stdin.write(stdin_bytes)
+    finally:
+        process.stdin.close()
+    return process
+
+def _evaluate_output(worker_id, seed, returncode, stdout, stderr):
+    """
+    Converts the captured output of one finished worker into the game_creator format.
+    Returns:
+        dict: {"state": bool, "Text": str}
+    """
+    stdout = stdout if stdout else ""
+    stderr = stderr if stderr else ""
+
+    # --- Evaluation ---
+    if "[FUZZ] SUCCESS" in stdout:
+        print(f"✅ Fuzzer Worker {worker_id} (seed={seed}): Test Passed")
+        return {"state": True, "Text": "Test Passed"}
+
+    # Only a crash fails a worker: non-zero exit / killed by a signal, or an uncaught Traceback.
+    # A clean exit without the marker is the chaos agent hitting Quit, and stderr then only holds warnings.
+    if returncode == 0 and "Traceback" not in stderr:
+        print(f"✅ Fuzzer Worker {worker_id} (seed={seed}): Game exited cleanly (Considered Passed)")
+        return {"state": True, "Text": "Test Passed (Game Exited Cleanly)"}
+
+    print(f"❌ Fuzzer Worker {worker_id} (seed={seed}): Test Failed (Return Code: {returncode})")
+
+    # Compose error message for error_solving function
+    # Priority given to stderr (Python Tracebacks), fallback to stdout trailing logs
+    error_content = ""
+    if stderr.strip():
+        error_content = stderr
+    else:
+        error_content = stdout[-1000:] # Capture last 1000 characters
+
+    # Manual fallback if content is empty
+    if not error_content.strip():
+        error_content = "Unknown Error: Program crashed without capturing error messages (Silent Crash)."
+
+    return {"state": False, "Text": error_content}
+
+def _survived_result(worker_id, seed):
+    print(f"✅ Fuzzer Worker {worker_id} (seed={seed}): Test duration ended, game survived (Considered Passed)")
+    return {"state": True, "Text": "Test Passed (Game Survived Duration)"}
+
+def _collect_worker_result(worker_id, seed, process, timeout=FUZZ_TIMEOUT_SEC):
+    """
+    Blocking fallback for platforms where pipes cannot be polled (Windows).
+    Waits for a single fuzz worker and converts its output into the game_creator format.
+    """
+    try:
+        # Capture output (Captures all errors printed by debug_launcher)
+        stdout, stderr = process.communicate(timeout=timeout)
+        return _evaluate_output(
+            worker_id, seed, process.returncode,
+            stdout.decode("utf-8", errors="replace"),
+            stderr.decode("utf-8", errors="replace")
+        )
+
+    except subprocess.TimeoutExpired:
+        try:
+            process.kill()
+            process.communicate()
+        except:
+            pass
+        return _survived_result(worker_id, seed)
+
+def _poll_workers(processes, timeout=FUZZ_TIMEOUT_SEC):
+    """
+    Non-blocking poll loop over the stdout/stderr pipes of every worker (POSIX only).
+    A worker is settled the moment the SUCCESS marker appears in its stdout,
+    so passing games no longer sit out the whole timeout while exiting.
+    Returns:
+        list: one result dict per worker, in launch order
+    """
+    selector = selectors.DefaultSelector()
+    outputs = {}
+    scanners = {}
+    open_streams = {}
+
+    for worker_id, seed, process in processes:
+        outputs[worker_id] = {
+            "stdout": _TailBuffer(STDOUT_TAIL_BYTES),
+            "stderr": _TailBuffer(STDERR_TAIL_BYTES),
+        }
+        scanners[worker_id] = _MarkerScanner()
+        open_streams[worker_id] = 2
+        for name in ("stdout", "stderr"):
+            stream = getattr(process, name)
+            os.set_blocking(stream.fileno(), False)
+            selector.register(stream, selectors.EVENT_READ, (worker_id, name))
+
+    results = {}
+    deadline = time.monotonic() + timeout
+    try:
+        while len(results) < len(processes) and time.monotonic() < deadline:
+            for key, _ in selector.select(timeout=0.05):
+                worker_id, name = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                if chunk:
+                    outputs[worker_id][name].extend(chunk)
+                    if name == "stdout":
+                        scanners[worker_id].feed(chunk)
+                else:
+                    selector.unregister(key.fileobj)
+                    open_streams[worker_id] -= 1
+
+            for worker_id, seed, process in processes:
+                if worker_id in results:
+                    continue
+                output = outputs[worker_id]
+
+                if scanners[worker_id].found:
+                    # Game already reported success, no need to wait for it to exit
+                    process.terminate()
+                    results[worker_id] = _evaluate_output(
+                        worker_id, seed, 0, SUCCESS_MARKER.decode(), ""
+                    )
+                elif open_streams[worker_id] == 0 and process.poll() is not None:
+                    results[worker_id] = _evaluate_output(
+                        worker_id, seed, process.returncode,
+                        output["stdout"].decode("utf-8", errors="replace"),
+                        output["stderr"].decode("utf-8", errors="replace")
+                    )
+    finally:
+        selector.close()
+
+    # Hard ceiling reached: whoever is still running survived the whole duration
+    for worker_id, seed, process in processes:
+        if worker_id not in results:
+            results[worker_id] = _survived_result(worker_id, seed)
+
+    return [results[worker_id] for worker_id, _, _ in processes]
+
+def run_fuzz_test(target_path_arg=None, num_workers=None):
     """
     Executes Fuzzer test and returns a dictionary compatible with game_creator format.
+    Launches `num_workers` fuzz processes in parallel (default: one per CPU core, at most FUZZ_MAX_WORKERS),
+    each with a distinct chaos RNG seed, and aggregates their results.
     Returns:
         dict: {"state": bool, "Text": str}
     """
@@ -33,82 +296,71 @@ def run_fuzz_test(target_path_arg=None):
     if not os.path.exists(target_script):
         return {"state": False, "Text": f"Fuzzer Error: Target file {target_script} not found"}
 
-    # 2. Prepare Injection Wrapper
-    wrapper_script_path = os.path.join(base_dir, "temp_fuzz_wrapper.py")
+    if num_workers is None:
+        num_workers = min(os.cpu_count() or 1, FUZZ_MAX_WORKERS)
+    num_workers = max(1, num_workers)
+
+    # 2. Prepare Injected Code (shared by all workers, the seed is passed via environment)
+    # The code is piped to `python -`, so nothing is written to disk.
+    # __file__ is pinned to the target so path logic in the launcher / game keeps working.
     try:
-        with open(target_script, "r", encoding="utf-8-sig", errors="replace") as f:
-            original_code = f.read()
-        injected_code = f"{CHAOS_PAYLOAD}\n\n# --- ORIGINAL GAME CODE ---\n{original_code}"
-        with open(wrapper_script_path, "w", encoding="utf-8") as f:
-            f.write(injected_code)
+        with open(target_script, "rb") as f:
+            original_bytes = f.read()
+        # A BOM is only legal at the very start of a file, it must not follow the payload
+        original_bytes = original_bytes.removeprefix(codecs.BOM_UTF8)
+        script_prelude = (
+            f"__file__ = {target_script!r}\n"
+            f"import sys as _fuzz_sys; _fuzz_sys.path.insert(0, {os.path.dirname(target_script)!r})\n"
+        ).encode("utf-8")
+        injected_bytes = b"".join((script_prelude, CHAOS_PAYLOAD_BYTES, ORIGINAL_CODE_HEADER, original_bytes))
     except Exception as e:
-        return {"state": False, "Text": f"Fuzzer Error: Failed to write temporary file - {e}"}
+        return {"state": False, "Text": f"Fuzzer Error: Failed to read target file - {e}"}
 
     # 3. Execute Test
-    print(f"🚀 Launching Fuzzer... (Wrapper: {wrapper_script_path})")
+    print(f"🚀 Launching Fuzzer with {num_workers} worker(s)... (Injected code via stdin, {len(injected_bytes)} bytes)")
     
-    process = None
+    processes = []
     try:
-        my_env = os.environ.copy()
-        my_env["PYTHONIOENCODING"] = "utf-8"
+        for worker_id in range(num_workers):
+            seed = random.randrange(2 ** 32)
+            my_env = os.environ.copy()
+            my_env["PYTHONIOENCODING"] = "utf-8"
+            my_env["FUZZ_SEED"] = str(seed)
+            my_env["FUZZ_DEST_PATH"] = dest_dir
 
-        process = subprocess.Popen(
-            [sys.executable, wrapper_script_path],
-            cwd=base_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE, # Critical: Must capture stderr for Tracebacks
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            env=my_env
-        )
+            process = _launch_worker([sys.executable, "-"], my_env, base_dir, injected_bytes)
+            processes.append((worker_id, seed, process))
 
-        try:
-            # Capture output (Captures all errors printed by debug_launcher)
-            stdout, stderr = process.communicate(timeout=20)
-            
-            stdout = stdout if stdout else ""
-            stderr = stderr if stderr else ""
-
-            # --- Evaluation ---
-            if "[FUZZ] SUCCESS" in stdout:
-                print("✅ Fuzzer: Test Passed")
-                return {"state": True, "Text": "Test Passed"}
-            
-            else:
-                print(f"❌ Fuzzer: Test Failed (Return Code: {process.returncode})")
-                
-                # Compose error message for error_solving function
-                # Priority given to stderr (Python Tracebacks), fallback to stdout trailing logs
-                error_content = ""
-                if stderr.strip():
-                    error_content = stderr
-                else:
-                    error_content = stdout[-1000:] # Capture last 1000 characters
-                
-                # Manual fallback if content is empty
-                if not error_content.strip():
-                    error_content = "Unknown Error: Program crashed without capturing error messages (Silent Crash)."
+        # Wait for all workers concurrently, each one keeps the same 20s ceiling
+        if os.name == "posix":
+            results = _poll_workers(processes)
+        else:
+            with ThreadPoolExecutor(max_workers=num_workers) as pool:
+                results = list(pool.map(lambda item: _collect_worker_result(*item), processes))
 
-                return {"state": False, "Text": error_content}
+        # --- Aggregation: a single crashing worker fails the whole campaign, reported with the first crash ---
+        for result in results:
+            if not result["state"]:
+                return result
 
-        except subprocess.TimeoutExpired:
-            print("\n✅ Fuzzer: Test duration ended, game survived (Considered Passed)")
-            try:
-                process.kill()
-            except:
-                pass
-            return {"state": True, "Text": "Test Passed (Game Survived Duration)"}
+        print(f"✅ Fuzzer: All {num_workers} worker(s) passed")
+        return {"state": True, "Text": results[0]["Text"]}
 
     except Exception as e:
         print(f"❌ Fuzzer: Execution Exception")
         return {"state": False, "Text": f"Fuzzer Internal Error: {e}"}
         
     finally:
-        if os.path.exists(wrapper_script_path):
-            try:
-                os.remove(wrapper_script_path)
-            except: pass
+        for _, _, process in processes:
+            if process.poll() is None:
+                try:
+                    process.kill()
+                    process.wait()
+                except: pass
+            for stream in (process.stdout, process.stderr):
+                try:
+                    stream.close()
+                except: pass
 
 if __name__ == "__main__":
     # For standalone testing
@@ -0,0 +1,118 @@
+import sys
+import os
+import json
+import time
+import runpy
+import signal
+import tempfile
+import traceback
+
+# Persistent debug worker (POSIX only)
+# Keeps one warm interpreter with pygame already imported and runs every
+# candidate script in a forked child, so compile_and_debug does not pay
+# the Python + pygame startup cost on every attempt.
+#
+# Protocol: one absolute script path per line on stdin,
+#           one JSON line per script on stdout:
+#           {"returncode": int | None, "stderr": str, "timeout": bool}
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+try:
+    import pygame                                                   #type:ignore
+except ImportError:
+    pass
+
+# Reserve the real stdout for the protocol, everything else the worker prints goes to stderr
+_protocol_out = sys.stdout
+sys.stdout = sys.stderr
+
+
+def _run_child(full_path: str, err_fd: int):
+    """
+    Runs inside the forked child: redirect output, then execute the script as __main__.
+    Never returns, the child always leaves through os._exit.
+    """
+    exit_code = 0
+    try:
+        devnull_fd = os.open(os.devnull, os.O_RDWR)
+        os.dup2(devnull_fd, 0)     # Detach from the worker's protocol pipe, the game must not read it
+        os.dup2(devnull_fd, 1)     # Game stdout is ignored, same as subprocess.run(capture_output)
+        os.dup2(err_fd, 2)         # Game stderr carries the Traceback back to the parent
+
+        folder = os.path.dirname(full_path)
+        os.chdir(folder)
+        sys.argv = [full_path]
+        sys.stdin = open(0, "r", closefd=False)
+        sys.path[0] = folder
+        sys.stdout = open(1, "w", encoding="utf-8", errors="ignore", closefd=False)
+        sys.stderr = open(2, "w", encoding="utf-8", errors="ignore", closefd=False)
+
+        runpy.run_path(full_path, run_name="__main__")
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            exit_code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException as e:
+        # Drop the worker/runpy frames so the Traceback looks like a plain `python script.py` run
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != full_path:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb or e.__traceback__)
+        exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except Exception:
+            pass
+        os._exit(exit_code)
+
+
+def run_script(full_path: str, timeout: float) -> dict:
+    """
+    Forks a child for `full_path` and waits for it at most `timeout` seconds.
+    """
+    with tempfile.TemporaryFile() as err_file:
+        pid = os.fork()
+        if pid == 0:
+            _run_child(full_path, err_file.fileno())
+
+        deadline = time.monotonic() + timeout
+        returncode = None
+        timed_out = False
+        while True:
+            finished_pid, status = os.waitpid(pid, os.WNOHANG)
+            if finished_pid:
+                returncode = os.waitstatus_to_exitcode(status)
+                break
+            if time.monotonic() >= deadline:
+                timed_out = True
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                break
+            time.sleep(0.05)
+
+        err_file.seek(0)
+        stderr = err_file.read().decode("utf-8", errors="ignore")
+
+    return {"returncode": returncode, "stderr": stderr, "timeout": timed_out}
+
+
+def main():
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    for line in sys.stdin:
+        full_path = line.strip()
+        if not full_path:
+            continue
+        try:
+            outcome = run_script(full_path, timeout)
+        except Exception as e:
+            outcome = {"returncode": None, "stderr": f"Debug worker error: {e}", "timeout": False}
+        _protocol_out.write(json.dumps(outcome) + "\n")
+        _protocol_out.flush()
+
+
+if __name__ == "__main__":
+    main()
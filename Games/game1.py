@@ -5,13 +5,16 @@ import enum
 from pygame.math import Vector2
 
 # --- RAG 類別定義開始 ---
+# 未提供 image 時共用的透明 1x1 Surface，只建立一次
+_EMPTY_IMAGE = pygame.Surface((1, 1), pygame.SRCALPHA)
+
 # 基礎精靈類別: GameSprite
 # 負責處理位置與移動，並維持 pygame 的 Sprite 屬性一致性。
 class GameSprite(pygame.sprite.Sprite):
     def __init__(self, image=None, rect=None, pos=None, velocity=None):
         super().__init__()
-        # 如果沒有 image，則建立一個透明的 1x1 Surface
-        self.image = image if image is not None else pygame.Surface((1, 1), pygame.SRCALPHA)
+        # 如果沒有 image，則使用共用的透明 1x1 Surface
+        self.image = image if image is not None else _EMPTY_IMAGE
         # 如果沒有 rect，則從 image 獲取
         self.rect = rect if rect is not None else self.image.get_rect()
         # pos 使用 Vector2 以確保高精度的位置運算 (相對於整數像素)
@@ -28,12 +31,19 @@ class GameSprite(pygame.sprite.Sprite):
 # 物件池類別: ObjectPool
 # 用於管理頻繁創建與銷毀的物件（如食物），提高記憶體與效能表現。
 class ObjectPool:
-    def __init__(self, object_factory, initial_size=10):
+    def __init__(self, object_factory, initial_size=10, max_size=None):
         self._object_factory = object_factory
         self._pool = collections.deque()
-        self._active_objects = set()
-        for _ in range(initial_size):
-            self._pool.append(self._object_factory()) # 預先生成物件緩衝
+        self._max_size = max_size # 池中閒置物件的上限，None 表示不限制
+        # 建立時先產生一個樣本物件，判斷一次是否具有 'reset' 方法，之後 get 不必每次 hasattr
+        probe = self._object_factory()
+        self._has_reset = hasattr(probe, 'reset')
+        probe._in_pool = True
+        self._pool.append(probe)
+        for _ in range(initial_size - 1):
+            obj = self._object_factory() # 預先生成物件緩衝
+            obj._in_pool = True
+            self._pool.append(obj)
 
     def get(self, *args, **kwargs):
         # 從物件池中獲取物件，若池空則創建新物件。
@@ -43,19 +53,22 @@ class ObjectPool:
             obj = self._pool.popleft()
 
         # 如果物件有 'reset' 方法，則呼叫它來初始化物件狀態。
-        if hasattr(obj, 'reset'):
+        if self._has_reset:
             obj.reset(*args, **kwargs)
         
-        self._active_objects.add(obj)
+        obj._in_pool = False # 以物件本身的旗標標記借出狀態，取代額外的 set 追蹤
         return obj
 
     def release(self, obj):
         # 將物件歸還至物件池中。
-        if obj in self._active_objects:
-            self._active_objects.remove(obj)
-            self._pool.append(obj)
+        # 只接受由物件池借出且尚未歸還的物件，重複歸還或外來物件直接忽略
+        if getattr(obj, '_in_pool', True) is False:
+            obj._in_pool = True
             # 將精靈從所有群組中移除，避免它繼續在畫面上渲染。
             obj.kill() 
+            # 池已滿時不再保留，交給 GC 回收，避免突發用量後池子一直維持在高峰大小
+            if self._max_size is None or len(self._pool) < self._max_size:
+                self._pool.append(obj)
 
 # --- RAG 類別定義結束 ---
 
@@ -73,8 +86,19 @@ SCREEN_HEIGHT = 400
 GRID_SIZE = 20 # 貪食蛇與食物的大小（格點尺寸）
 INITIAL_FPS = 5 # 初始每秒幀數，用來控制蛇的移動速度 (低速開始)
 MAX_FPS = 20 # 最高限制速度
+RENDER_FPS = 60 # 畫面更新頻率，與蛇的移動速度脫鉤
+MAX_FRAME_DT = 0.25 # 單幀 dt 上限，避免視窗卡頓後蛇一次暴衝多格
+HIDDEN_WAIT_MS = 100 # 視窗最小化時每輪迴圈的等待時間 (毫秒)
+HUD_CACHE_SIZE = 64 # HUD 文字快取上限，超過時整批清空
+SPRITE_LAYER = 0 # 蛇與食物所在圖層
+HUD_LAYER = 1 # HUD 文字圖層，永遠疊在蛇與食物之上
 FPS_INCREMENT_SCORE_THRESHOLD = 50 # 每獲得 50 分時提升速度
 FPS_INCREMENT_VALUE = 1 # 每次提升的 FPS 值
+GRID_COLS = SCREEN_WIDTH // GRID_SIZE # 橫向格數
+GRID_ROWS = SCREEN_HEIGHT // GRID_SIZE # 縱向格數
+ALL_CELLS = frozenset((x, y) for x in range(GRID_COLS) for y in range(GRID_ROWS)) # 所有格點 (整數 tuple)
+TOTAL_CELLS = len(ALL_CELLS) # 格點總數
+FOOD_REJECTION_SAMPLING_RATIO = 0.7 # 蛇佔用格點低於此比例時，使用隨機抽樣生成食物
 
 BACKGROUND_COLOR = (0, 0, 0) # 黑色
 TEXT_COLOR = (255, 255, 255) # 白色
@@ -82,15 +106,20 @@ SNAKE_COLOR = (0, 255, 0) # 綠色
 FOOD_COLOR = (255, 0, 0) # 紅色
 
 # 字體設定：優先使用微軟正黑體以支援中文
-FONT_NAME = "microsoftjhenghei" 
-try:
-    pygame.font.match_font(FONT_NAME)
-except:
-    FONT_NAME = "simhei"
-    try:
-        pygame.font.match_font(FONT_NAME)
-    except:
-        FONT_NAME = None # 若找不到字體則回退至預設系統字體
+FONT_CANDIDATES = ("microsoftjhenghei", "simhei", "arialunicode")
+
+def get_font_path():
+    """依序查詢候選字體，回傳第一個找到的字體檔路徑；皆找不到時回傳 None (使用預設字體)。"""
+    for name in FONT_CANDIDATES:
+        try:
+            path = pygame.font.match_font(name)
+        except Exception:
+            path = None
+        if path:
+            return path
+    return None
+
+FONT_PATH = get_font_path() # 模組載入時只查詢一次，所有 Font 共用
 
 FONT_SIZE_HUD = 24 
 FONT_SIZE_MENU_TITLE = 48 
@@ -101,34 +130,90 @@ BUTTON_HOVER_COLOR = (100, 100, 100) # 亮灰色
 BUTTON_TEXT_COLOR = (255, 255, 255) 
 BUTTON_WIDTH = 200 
 BUTTON_HEIGHT = 50 
-BUTTON_MARGIN = 10 
+BUTTON_MARGIN = 10
+
+# 遊戲迴圈不處理的事件類型 (滑鼠移動由 mouse.get_pos 取代，hover 不依賴 MOUSEMOTION)
+UNHANDLED_EVENT_TYPES = [
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.KEYUP,
+    pygame.TEXTINPUT, pygame.TEXTEDITING,
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+]
+
+# 方向鍵與 WASD 對應的移動方向 (dx, dy)
+_DIR_KEYS = {
+    pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+    pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+    pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+    pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+} 
+
+# 純色方塊 Surface 快取：相同尺寸與顏色的精靈共用同一張 Surface
+_solid_surface_cache = {}
+
+def get_solid_surface(size, color):
+    """取得 (size, color) 對應的共用純色 Surface，首次使用時才建立。"""
+    key = (size, color)
+    surface = _solid_surface_cache.get(key)
+    if surface is None:
+        surface = pygame.Surface((size, size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() # 轉成與畫面相同的像素格式，blit 時不必逐像素轉換
+        surface.fill(color)
+        _solid_surface_cache[key] = surface
+    return surface
 
 # 遊戲物件類別: 蛇身段
-class SnakeSegment(GameSprite):
+# 混入 DirtySprite 以便放入 LayeredDirty，只重繪有變動的區域
+class SnakeSegment(GameSprite, pygame.sprite.DirtySprite):
     def __init__(self, grid_size=GRID_SIZE, color=SNAKE_COLOR):
-        image = pygame.Surface((grid_size, grid_size))
-        image.fill(color)
+        image = get_solid_surface(grid_size, color) # 所有蛇身共用同一張 Surface
         rect = image.get_rect()
         # 初始時放置在畫面外，待邏輯更新位置。
         super().__init__(image=image, rect=rect, pos=Vector2(-grid_size, -grid_size), velocity=Vector2(0,0))
-        self.rect.topleft = (int(self.pos.x), int(self.pos.y))
+        self.rect.topleft = (-grid_size, -grid_size) # 直接使用整數像素座標，不經 Vector2 浮點轉換
+        self._grid_size = grid_size
+
+    def reset(self, grid_pos):
+        # 由物件池取出時重新定位，與 Food.reset 相同傳入整數格點坐標 (col, row)，沿用既有的 Surface 與 Rect。
+        px, py = grid_pos[0] * self._grid_size, grid_pos[1] * self._grid_size
+        self.pos.update(px, py)
+        self.rect.topleft = (px, py)
+        self.dirty = 1
 
 # 遊戲物件類別: 食物
-class Food(GameSprite):
+class Food(GameSprite, pygame.sprite.DirtySprite):
     def __init__(self, grid_size=GRID_SIZE, color=FOOD_COLOR):
-        image = pygame.Surface((grid_size, grid_size))
-        image.fill(color)
+        image = get_solid_surface(grid_size, color) # 所有食物共用同一張 Surface
         rect = image.get_rect()
         super().__init__(image=image, rect=rect, pos=Vector2(-grid_size, -grid_size), velocity=Vector2(0,0))
-        self.rect.topleft = (int(self.pos.x), int(self.pos.y))
+        self.rect.topleft = (-grid_size, -grid_size) # 直接使用整數像素座標，不經 Vector2 浮點轉換
         self._grid_size = grid_size
         self._color = color
 
     def reset(self, grid_pos):
         # 重新初始化食物位置。
-        # grid_pos 傳入格點坐標 (col, row)。
-        self.pos = Vector2(grid_pos[0] * self._grid_size, grid_pos[1] * self._grid_size)
-        self.rect.topleft = (int(self.pos.x), int(self.pos.y))
+        # grid_pos 傳入整數格點坐標 (col, row)，直接就地更新 pos，不重新配置 Vector2。
+        px, py = grid_pos[0] * self._grid_size, grid_pos[1] * self._grid_size
+        self.pos.update(px, py)
+        self.rect.topleft = (px, py)
+        self.dirty = 1
+
+# HUD 文字精靈: 只有在換上不同的文字 Surface 時才標記為 dirty
+class HudText(pygame.sprite.DirtySprite):
+    def __init__(self, anchor, pos):
+        super().__init__()
+        self._anchor = anchor # rect 對齊方式，例如 "topleft" / "topright"
+        self._pos = pos
+        self.image = _EMPTY_IMAGE # 尚未設定文字前的佔位圖
+        self.rect = self.image.get_rect(**{anchor: pos})
+
+    def set_surface(self, surface):
+        if surface is not self.image:
+            self.image = surface
+            self.rect = surface.get_rect(**{self._anchor: self._pos})
+            self.dirty = 1
 
 # UI 元件: 按鈕
 class Button:
@@ -142,18 +227,21 @@ class Button:
         self.hover_color = hover_color
         self.text_color = text_color
         self.current_color = self.bg_color
-
-    def draw(self, screen):
-        mouse_pos = pygame.mouse.get_pos()
+        # 按鈕文字固定不變，建立時渲染一次即可
+        self._text_surface = font.render(text, True, text_color).convert_alpha()
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+
+    def draw(self, screen, mouse_pos=None):
+        # mouse_pos 由呼叫端每幀取得一次後傳入，避免每個按鈕各自查詢滑鼠位置
+        if mouse_pos is None:
+            mouse_pos = pygame.mouse.get_pos()
         if self.rect.collidepoint(mouse_pos):
             self.current_color = self.hover_color
         else:
             self.current_color = self.bg_color
 
         pygame.draw.rect(screen, self.current_color, self.rect, border_radius=5)
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        screen.blit(self._text_surface, self._text_rect)
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -170,10 +258,13 @@ class Game:
         pygame.display.set_caption("經典貪食蛇遊戲")
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.mouse.set_visible(True) 
+        # 遊戲不處理的高頻事件直接由 SDL 丟棄，不進入事件佇列
+        # (以 set_blocked 排除而非 set_allowed 白名單，避免擋掉 USEREVENT 等外部注入的事件)
+        pygame.event.set_blocked(UNHANDLED_EVENT_TYPES)
 
-        self.font_hud = pygame.font.Font(pygame.font.match_font(FONT_NAME), FONT_SIZE_HUD)
-        self.font_menu_title = pygame.font.Font(pygame.font.match_font(FONT_NAME), FONT_SIZE_MENU_TITLE)
-        self.font_menu_button = pygame.font.Font(pygame.font.match_font(FONT_NAME), FONT_SIZE_MENU_BUTTON)
+        self.font_hud = pygame.font.Font(FONT_PATH, FONT_SIZE_HUD)
+        self.font_menu_title = pygame.font.Font(FONT_PATH, FONT_SIZE_MENU_TITLE)
+        self.font_menu_button = pygame.font.Font(FONT_PATH, FONT_SIZE_MENU_BUTTON)
 
         self.clock = pygame.time.Clock()
         self.running = True
@@ -186,20 +277,39 @@ class Game:
 
         # 遊戲物件與數據
         self.snake_segments = collections.deque() 
-        self.snake_direction = Vector2(0, 0)
-        self.new_direction = Vector2(0, 0) 
+        self.snake_cells = collections.deque() # 與 snake_segments 平行的整數格點座標 (頭在前)
+        self.snake_cell_set = set() # 蛇身佔用格點集合，供 O(1) 碰撞查詢
+        self.snake_direction = (0, 0) # 方向以整數 tuple (dx, dy) 表示，避免每步建立 Vector2
+        self.new_direction = (0, 0) 
         self.score = 0
         self.current_fps = INITIAL_FPS 
         self.snake_move_timer = 0 
 
         # 初始化物件池與精靈群組
-        self.food_pool = ObjectPool(lambda: Food(GRID_SIZE, FOOD_COLOR), initial_size=5)
-        self.all_sprites = pygame.sprite.Group() 
+        self.food_pool = ObjectPool(lambda: Food(GRID_SIZE, FOOD_COLOR), initial_size=5, max_size=5)
+        self.segment_pool = ObjectPool(lambda: SnakeSegment(GRID_SIZE, SNAKE_COLOR), initial_size=64, max_size=TOTAL_CELLS)
+        self.all_sprites = pygame.sprite.LayeredDirty() 
         self.food_sprite = None 
+        self.food_cell = None # 食物所在格點 (整數 tuple)
 
         # UI 按鈕設置
         self.buttons = []
         self._setup_menus() 
+        self._prerender_text()
+
+        # 遊戲中採用 dirty rect 渲染：背景用來擦除移走的精靈，HUD 作為最上層精靈一併管理
+        self._background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self._background.fill(BACKGROUND_COLOR)
+        self.all_sprites.clear(self.screen, self._background)
+        self.hud_score = HudText("topleft", (10, 10))
+        self.hud_speed = HudText("topright", (SCREEN_WIDTH - 10, 10))
+        self.all_sprites.add(self.hud_score, self.hud_speed, layer=HUD_LAYER)
+        self._full_redraw = True # 下一幀是否需整個畫面重繪 (切換狀態或視窗重新曝光時)
+        self._window_visible = True # 視窗最小化或隱藏時不渲染
+
+        # 暫停畫面的半透明黑色遮罩只建立一次，之後每幀直接 blit
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._pause_overlay.fill((0, 0, 0, 128))
 
         # 啟動進入選單狀態
         self.change_state(GameStates.MENU)
@@ -233,6 +343,57 @@ class Game:
             Button("返回", SCREEN_WIDTH // 2, SCREEN_HEIGHT - BUTTON_HEIGHT - BUTTON_MARGIN, BUTTON_WIDTH, BUTTON_HEIGHT, self.font_menu_button, self._return_from_rules)
         ]
 
+    def _prerender_text(self):
+        """預先渲染各介面的靜態文字，draw 時只需 blit，不必每幀呼叫 font.render。"""
+        def centered(font, text, center):
+            surf = font.render(text, True, TEXT_COLOR).convert_alpha()
+            return surf, surf.get_rect(center=center)
+
+        self._title_surf, self._title_rect = centered(self.font_menu_title, "經典貪食蛇遊戲", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 3))
+        self._paused_surf, self._paused_rect = centered(self.font_menu_title, "暫停中", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 3))
+        self._game_over_surf, self._game_over_rect = centered(self.font_menu_title, "遊戲結束", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 2))
+        self._rules_title_surf, self._rules_title_rect = centered(self.font_menu_title, "遊戲規則", (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
+
+        rules_content = [
+            "1. 控制蛇在 600x400 的空間中移動。",
+            "2. 吃到紅色食物會增加長度與 10 分。",
+            "3. 撞到牆壁或自己的身體則遊戲結束。",
+            "4. 速度會隨著得分提高而逐漸加快。",
+            "5. 按 'P' 或 'ESC' 可進入暫停選單。",
+            "6. 使用方向鍵或 WASD 鍵進行移動。"
+        ]
+        self._rules_line_surfs = []
+        y_offset = self._rules_title_rect.bottom + 20
+        for rule in rules_content:
+            rule_surface, rule_rect = centered(self.font_hud, rule, (SCREEN_WIDTH // 2, y_offset))
+            self._rules_line_surfs.append((rule_surface, rule_rect))
+            y_offset += rule_surface.get_height() + 5
+
+        # 最終得分只在分數改變時重新渲染，以分數值為鍵快取
+        self._final_score_cache = {}
+        # HUD 文字快取，鍵為 (標籤, 數值)
+        self._hud_cache = {}
+
+    def _hud_surf(self, kind, value):
+        """取得 HUD 文字 Surface，數值未改變時直接重用快取。"""
+        key = (kind, value)
+        surf = self._hud_cache.get(key)
+        if surf is None:
+            if len(self._hud_cache) >= HUD_CACHE_SIZE:
+                self._hud_cache.clear()
+            surf = self.font_hud.render(f"{kind}: {value}", True, TEXT_COLOR).convert_alpha()
+            self._hud_cache[key] = surf
+        return surf
+
+    def _final_score_surf(self, score):
+        cached = self._final_score_cache.get(score)
+        if cached is None:
+            if len(self._final_score_cache) >= 16:
+                self._final_score_cache.clear()
+            cached = self.font_menu_button.render(f"最終得分: {score}", True, TEXT_COLOR).convert_alpha()
+            self._final_score_cache[score] = cached
+        return cached
+
     def _return_from_rules(self):
         """從規則介面返回前一個狀態。"""
         if self.previous_state:
@@ -275,24 +436,27 @@ class Game:
         """重置遊戲狀態，清除蛇與食物。"""
         while self.snake_segments:
             segment = self.snake_segments.popleft() 
-            self.all_sprites.remove(segment)
+            self.segment_pool.release(segment) # 歸還物件池 (release 會一併將其移出所有群組)
         
         if self.food_sprite:
             self.food_pool.release(self.food_sprite) 
             self.food_sprite = None
 
         # 初始化蛇的位置 (格點座標)
-        initial_pos_grid = Vector2((SCREEN_WIDTH // 2 // GRID_SIZE) - 1, (SCREEN_HEIGHT // 2 // GRID_SIZE))
+        start_x, start_y = GRID_COLS // 2 - 1, GRID_ROWS // 2
         self.snake_segments = collections.deque()
+        self.snake_cells = collections.deque()
+        self.snake_cell_set = set()
         for i in range(3): # 初始蛇長: 3
-            segment = SnakeSegment(GRID_SIZE, SNAKE_COLOR)
-            segment.pos = (initial_pos_grid - Vector2(i, 0)) * GRID_SIZE 
-            segment.rect.topleft = (int(segment.pos.x), int(segment.pos.y))
+            cell = (start_x - i, start_y)
+            segment = self.segment_pool.get(cell)
             self.snake_segments.append(segment)
-            self.all_sprites.add(segment)
+            self.all_sprites.add(segment, layer=SPRITE_LAYER)
+            self.snake_cells.append(cell)
+            self.snake_cell_set.add(cell)
 
-        self.snake_direction = Vector2(1, 0) # 初始向右
-        self.new_direction = Vector2(1, 0) 
+        self.snake_direction = (1, 0) # 初始向右
+        self.new_direction = (1, 0) 
         self.score = 0
         self.current_fps = INITIAL_FPS
         self.snake_move_timer = 0
@@ -304,57 +468,70 @@ class Game:
         if self.food_sprite:
             self.food_pool.release(self.food_sprite) 
             self.food_sprite = None
+            self.food_cell = None
+
+        # 蛇身佔用格點集合 (整數 tuple) 已隨移動維護，每次查詢皆為 O(1)
+        occupied = self.snake_cell_set
+
+        food_grid_pos = None
+        if len(occupied) < TOTAL_CELLS * FOOD_REJECTION_SAMPLING_RATIO:
+            # 蛇還不長時：隨機抽格點直到抽中空格 (期望 O(1) 次)
+            while food_grid_pos is None:
+                cell = (random.randrange(GRID_COLS), random.randrange(GRID_ROWS))
+                if cell not in occupied:
+                    food_grid_pos = cell
+        else:
+            # 蛇很長時：以預先建立的全格點集合做差集 (C 層級運算)，再從剩餘空格中隨機挑選
+            free_cells = ALL_CELLS - occupied
+            if free_cells:
+                food_grid_pos = random.choice(tuple(free_cells))
 
-        empty_positions = []
-        for x in range(SCREEN_WIDTH // GRID_SIZE):
-            for y in range(SCREEN_HEIGHT // GRID_SIZE):
-                grid_pos = Vector2(x, y)
-                is_occupied = False
-                for segment in self.snake_segments:
-                    if Vector2(segment.pos.x / GRID_SIZE, segment.pos.y / GRID_SIZE) == grid_pos:
-                        is_occupied = True
-                        break
-                if not is_occupied:
-                    empty_positions.append(grid_pos)
-        
-        if not empty_positions:
+        if food_grid_pos is None:
             # 如果沒有空間放食物，代表玩家獲勝（或填滿格點）
             print("無剩餘空間生成食物！")
             self.change_state(GameStates.GAME_OVER)
             return 
 
-        food_grid_pos = random.choice(empty_positions)
+        self.food_cell = food_grid_pos
         self.food_sprite = self.food_pool.get(food_grid_pos) 
-        self.all_sprites.add(self.food_sprite) 
+        self.all_sprites.add(self.food_sprite, layer=SPRITE_LAYER) 
 
     def handle_input(self):
         """處理鍵盤與滑鼠事件。"""
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            # 事件類型在下方會被多次比對，先取成區域變數
+            # (self.buttons 會隨狀態切換而改變，因此仍每次讀取，不提到迴圈外)
+            event_type = event.type
+            if event_type == pygame.QUIT:
                 self.running = False
+            elif event_type == pygame.VIDEOEXPOSE:
+                self._full_redraw = True # 視窗內容可能已被覆蓋，需整頁重繪
+            elif event_type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                self._window_visible = False
+            elif event_type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                self._window_visible = True
+                self._full_redraw = True
+            elif event_type == pygame.WINDOWFOCUSLOST and self.state == GameStates.PLAYING:
+                self.change_state(GameStates.PAUSED) # 失去焦點時自動暫停，避免蛇在玩家看不到時撞牆
 
             if self.state == GameStates.PLAYING:
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_UP or event.key == pygame.K_w:
-                        if self.snake_direction.y == 0: 
-                            self.new_direction = Vector2(0, -1)
-                    elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                        if self.snake_direction.y == 0:
-                            self.new_direction = Vector2(0, 1)
-                    elif event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                        if self.snake_direction.x == 0:
-                            self.new_direction = Vector2(-1, 0)
-                    elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                        if self.snake_direction.x == 0:
-                            self.new_direction = Vector2(1, 0)
+                if event_type == pygame.KEYDOWN:
+                    new_direction = _DIR_KEYS.get(event.key)
+                    if new_direction is not None:
+                        # 只接受與目前方向垂直的轉向：不允許直接掉頭，同方向也不覆蓋已排定的轉向
+                        dx, dy = self.snake_direction
+                        if new_direction[0] * dx + new_direction[1] * dy == 0:
+                            self.new_direction = new_direction
                     elif event.key == pygame.K_p or event.key == pygame.K_ESCAPE:
                         self.change_state(GameStates.PAUSED)
             
-            for button in self.buttons:
-                if button.handle_event(event):
-                    break 
+            # 只有滑鼠左鍵按下才需要逐一檢查按鈕，其餘事件直接略過
+            if event_type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                for button in self.buttons:
+                    if button.handle_event(event):
+                        break 
 
-            if self.state in [GameStates.PAUSED, GameStates.RULES] and event.type == pygame.KEYDOWN:
+            if self.state in [GameStates.PAUSED, GameStates.RULES] and event_type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     if self.state == GameStates.PAUSED:
                         self.change_state(GameStates.PLAYING)
@@ -362,125 +539,123 @@ class Game:
                         self._return_from_rules()
 
 
+    def _step_snake(self):
+        """蛇前進一格，並處理碰撞與吃食物。"""
+        self.snake_direction = direction = self.new_direction 
+        # 每步會重複使用的屬性先取成區域變數，減少屬性查找
+        cells = self.snake_cells
+        cell_set = self.snake_cell_set
+        segments = self.snake_segments
+        segment_pool = self.segment_pool
+
+        # 以整數格點計算新蛇頭，只在寫入精靈時換算成像素座標
+        head_x, head_y = cells[0]
+        new_head_x, new_head_y = head_x + direction[0], head_y + direction[1]
+        new_head_cell = (new_head_x, new_head_y)
+
+        # 碰撞檢測 (先判斷，撞到時不必再從物件池取出蛇頭)：
+        # 1. 牆壁邊界
+        if not (0 <= new_head_x < GRID_COLS and 0 <= new_head_y < GRID_ROWS):
+            self.change_state(GameStates.GAME_OVER)
+            return
+
+        # 2. 蛇身碰撞 (集合中尚未包含新蛇頭，尾巴此時也還在)
+        if new_head_cell in cell_set:
+            self.change_state(GameStates.GAME_OVER)
+            return
+
+        # 將新蛇頭加入隊列與顯示群組，格點與精靈兩個 deque 同步更新
+        new_head_segment = segment_pool.get(new_head_cell)
+        segments.appendleft(new_head_segment)
+        self.all_sprites.add(new_head_segment, layer=SPRITE_LAYER) 
+        cells.appendleft(new_head_cell)
+        cell_set.add(new_head_cell)
+
+        # 3. 吃到食物
+        if self.food_sprite: 
+            if new_head_cell == self.food_cell:
+                self.score += 10 
+                if self.score % FPS_INCREMENT_SCORE_THRESHOLD == 0 and self.current_fps < MAX_FPS:
+                    self.current_fps += FPS_INCREMENT_VALUE
+                self.spawn_food() 
+            else:
+                # 沒吃到食物，移除蛇尾以保持長度
+                segment_pool.release(segments.pop())
+                cell_set.discard(cells.pop())
+
     def update(self, dt):
-        """更新遊戲邏輯（移動與碰撞）。"""
+        """更新遊戲邏輯：以累加器 (fixed timestep) 依 current_fps 推進蛇的移動。"""
         if self.state == GameStates.PLAYING:
             self.snake_move_timer += dt
-            # 根據 FPS 決定蛇的移動步長
-            if self.snake_move_timer >= 1.0 / self.current_fps:
-                self.snake_move_timer = 0
-                self.snake_direction = self.new_direction 
-
-                # 獲取蛇頭格點座標並計算新座標
-                head_pos_grid = Vector2(self.snake_segments[0].pos.x / GRID_SIZE, self.snake_segments[0].pos.y / GRID_SIZE)
-                new_head_grid = head_pos_grid + self.snake_direction
-                
-                new_head_segment = SnakeSegment(GRID_SIZE, SNAKE_COLOR)
-                new_head_segment.pos = new_head_grid * GRID_SIZE 
-                new_head_segment.rect.topleft = (int(new_head_segment.pos.x), int(new_head_segment.pos.y)) 
-
-                # 將新蛇頭加入隊列與顯示群組
-                self.snake_segments.appendleft(new_head_segment)
-                self.all_sprites.add(new_head_segment) 
-
-                # 碰撞檢測：
-                # 1. 牆壁邊界
-                if not (0 <= new_head_grid.x < SCREEN_WIDTH // GRID_SIZE and
-                        0 <= new_head_grid.y < SCREEN_HEIGHT // GRID_SIZE):
-                    self.change_state(GameStates.GAME_OVER)
-                    return
-
-                # 2. 蛇身碰撞 (不檢查剛加入的頭部，所以從 index 1 開始)
-                for segment in list(self.snake_segments)[1:]: 
-                    segment_grid_pos = Vector2(segment.pos.x / GRID_SIZE, segment.pos.y / GRID_SIZE)
-                    if new_head_grid == segment_grid_pos:
-                        self.change_state(GameStates.GAME_OVER)
-                        return
-
-                # 3. 吃到食物
-                if self.food_sprite: 
-                    food_grid_pos = Vector2(self.food_sprite.pos.x / GRID_SIZE, self.food_sprite.pos.y / GRID_SIZE)
-                    if new_head_grid == food_grid_pos:
-                        self.score += 10 
-                        if self.score % FPS_INCREMENT_SCORE_THRESHOLD == 0 and self.current_fps < MAX_FPS:
-                            self.current_fps += FPS_INCREMENT_VALUE
-                        self.spawn_food() 
-                    else:
-                        # 沒吃到食物，移除蛇尾以保持長度
-                        tail_segment = self.snake_segments.pop()
-                        self.all_sprites.remove(tail_segment)
-
-        # 更新所有精靈的狀態
-        self.all_sprites.update(dt)
+            # 畫面以 RENDER_FPS 更新，蛇則在累積時間達到一步時才移動 (可能一幀內補走多步)
+            step_time = 1.0 / self.current_fps
+            while self.state == GameStates.PLAYING and self.snake_move_timer >= step_time:
+                self.snake_move_timer -= step_time
+                self._step_snake()
+                step_time = 1.0 / self.current_fps
+
+        # 蛇身、食物與 HUD 精靈的 update 皆為空操作 (位置在 _step_snake 中直接設定)，
+        # 因此不再每幀呼叫 all_sprites.update(dt) 走訪整個群組
 
     def draw(self):
         """渲染畫面。"""
+        if self.state == GameStates.PLAYING:
+            self._draw_playing()
+            return
+
+        # 選單類畫面每幀整頁重繪，回到遊戲時也需要整頁重繪一次
+        self._full_redraw = True
         self.screen.fill(BACKGROUND_COLOR)
+        mouse_pos = pygame.mouse.get_pos() # 每幀只查詢一次，供所有按鈕判斷 hover
 
-        if self.state == GameStates.PLAYING:
-            self.all_sprites.draw(self.screen) 
-
-            # HUD 資訊
-            score_text = self.font_hud.render(f"得分: {self.score}", True, TEXT_COLOR)
-            self.screen.blit(score_text, (10, 10))
-            speed_text = self.font_hud.render(f"速度: {self.current_fps}", True, TEXT_COLOR)
-            self.screen.blit(speed_text, (SCREEN_WIDTH - speed_text.get_width() - 10, 10))
-
-        elif self.state == GameStates.MENU:
-            title_text = self.font_menu_title.render("經典貪食蛇遊戲", True, TEXT_COLOR)
-            title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 3))
-            self.screen.blit(title_text, title_rect)
+        if self.state == GameStates.MENU:
+            self.screen.blit(self._title_surf, self._title_rect)
             for button in self.buttons:
-                button.draw(self.screen)
+                button.draw(self.screen, mouse_pos)
 
         elif self.state == GameStates.PAUSED:
-            self.all_sprites.draw(self.screen)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128)) # 半透明黑色遮罩
-            self.screen.blit(overlay, (0, 0))
+            self.screen.blits([(sprite.image, sprite.rect) for sprite in self.all_sprites.get_sprites_from_layer(SPRITE_LAYER)])
+            self.screen.blit(self._pause_overlay, (0, 0))
 
-            paused_text = self.font_menu_title.render("暫停中", True, TEXT_COLOR)
-            paused_rect = paused_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 3))
-            self.screen.blit(paused_text, paused_rect)
+            self.screen.blit(self._paused_surf, self._paused_rect)
             for button in self.buttons:
-                button.draw(self.screen)
+                button.draw(self.screen, mouse_pos)
 
         elif self.state == GameStates.GAME_OVER:
-            game_over_text = self.font_menu_title.render("遊戲結束", True, TEXT_COLOR)
-            game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT * 2))
-            self.screen.blit(game_over_text, game_over_rect)
+            self.screen.blit(self._game_over_surf, self._game_over_rect)
 
-            final_score_text = self.font_menu_button.render(f"最終得分: {self.score}", True, TEXT_COLOR)
+            final_score_text = self._final_score_surf(self.score)
             final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - BUTTON_HEIGHT))
             self.screen.blit(final_score_text, final_score_rect)
             for button in self.buttons:
-                button.draw(self.screen)
+                button.draw(self.screen, mouse_pos)
 
         elif self.state == GameStates.RULES:
-            rules_title_text = self.font_menu_title.render("遊戲規則", True, TEXT_COLOR)
-            rules_title_rect = rules_title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-            self.screen.blit(rules_title_text, rules_title_rect)
-
-            rules_content = [
-                "1. 控制蛇在 600x400 的空間中移動。",
-                "2. 吃到紅色食物會增加長度與 10 分。",
-                "3. 撞到牆壁或自己的身體則遊戲結束。",
-                "4. 速度會隨著得分提高而逐漸加快。",
-                "5. 按 'P' 或 'ESC' 可進入暫停選單。",
-                "6. 使用方向鍵或 WASD 鍵進行移動。"
-            ]
-            y_offset = rules_title_rect.bottom + 20
-            for rule in rules_content:
-                rule_surface = self.font_hud.render(rule, True, TEXT_COLOR)
-                rule_rect = rule_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
+            self.screen.blit(self._rules_title_surf, self._rules_title_rect)
+            for rule_surface, rule_rect in self._rules_line_surfs:
                 self.screen.blit(rule_surface, rule_rect)
-                y_offset += rule_surface.get_height() + 5
-            
+
             for button in self.buttons:
-                button.draw(self.screen)
+                button.draw(self.screen, mouse_pos)
 
         pygame.display.flip() 
 
+    def _draw_playing(self):
+        """遊戲中只重繪有變動的區域 (移走的蛇尾、新蛇頭、食物與 HUD)，再以 display.update 局部更新。"""
+        self.hud_score.set_surface(self._hud_surf("得分", self.score))
+        self.hud_speed.set_surface(self._hud_surf("速度", self.current_fps))
+
+        if self._full_redraw:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+            self.all_sprites.draw(self.screen)
+            pygame.display.flip()
+            self._full_redraw = False
+            return
+
+        dirty_rects = self.all_sprites.draw(self.screen)
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+
     def quit_game(self):
         self.running = False
 
@@ -492,12 +667,15 @@ class Game:
             pass 
 
         while self.running:
-            # 限制更新頻率並計算 Delta Time
-            dt = min(self.clock.tick(self.current_fps) / 1000.0, 0.05)
+            # 畫面固定以 RENDER_FPS 更新，蛇速由 update 內的累加器獨立控制
+            dt = min(self.clock.tick(RENDER_FPS) / 1000.0, MAX_FRAME_DT)
             
             self.handle_input()
             self.update(dt)
-            self.draw()
+            if self._window_visible:
+                self.draw()
+            else:
+                pygame.time.wait(HIDDEN_WAIT_MS) # 視窗看不到時跳過渲染並降低迴圈頻率
 
         pygame.quit() 
 
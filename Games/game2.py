@@ -2,6 +2,7 @@ import pygame
 import random
 import enum
 import collections
+import logging
 import math
 from typing import List, Tuple, Dict, Any, Optional, Set, Callable, TypeVar, Deque, Protocol, TYPE_CHECKING, Generic
 #太空射擊遊戲
@@ -10,6 +11,9 @@ from typing import List, Tuple, Dict, Any, Optional, Set, Callable, TypeVar, Deq
 if TYPE_CHECKING:
     from __main__ import Game # Assuming Game is in the same file for simplicity
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler()) # Silent unless the application configures logging
+
 # --- Configuration Constants ---
 SCREEN_WIDTH: int = 800
 SCREEN_HEIGHT: int = 600
@@ -24,6 +28,7 @@ BLUE: Tuple[int, int, int] = (0, 0, 255)
 YELLOW: Tuple[int, int, int] = (255, 255, 0)
 LIGHT_GREY: Tuple[int, int, int] = (200, 200, 200)
 ORANGE: Tuple[int, int, int] = (255, 165, 0)
+SPRITE_COLORKEY: Tuple[int, int, int] = (255, 0, 255)  # Transparent key for opaque sprite images
 
 # Game Entities & Values (from Technical Proposal)
 PLAYER_SPEED: float = 300.0  # pixels/sec
@@ -31,6 +36,8 @@ PLAYER_INITIAL_HP: int = 3
 PLAYER_FIRE_RATE: float = 0.2  # seconds per shot (0.2s = 5 shots/sec)
 PLAYER_COLLISION_BOX_SIZE: Tuple[int, int] = (50, 50)
 PLAYER_START_POS: pygame.math.Vector2 = pygame.math.Vector2(SCREEN_WIDTH / 2, SCREEN_HEIGHT - 70)
+PLAYER_LEFT_KEYS: Tuple[int, ...] = (pygame.K_LEFT, pygame.K_a)
+PLAYER_RIGHT_KEYS: Tuple[int, ...] = (pygame.K_RIGHT, pygame.K_d)
 
 BULLET_SPEED: float = 600.0  # pixels/sec
 BULLET_DAMAGE: int = 1
@@ -48,6 +55,12 @@ ENEMY_SPAWN_RATE_RAMP_DURATION: float = 60.0  # Seconds over which spawn rate ra
 
 PARALLAX_BACKGROUND_SPEEDS: List[int] = [10, 25, 50]  # For 3 layers of stars
 
+PARTICLE_SIZES: List[int] = [2, 3, 4, 5]  # Explosion particle radii (contiguous range)
+PARTICLE_COLORS: List[Tuple[int, int, int]] = [RED, YELLOW, ORANGE]
+PARTICLE_POOL_WARMUP: int = 4  # Pre-built particles per (size, color) pool
+PARTICLE_ALPHA_LEVELS: int = 32  # Fade steps; the image alpha is only updated when the step changes
+PARTICLE_ALPHA_LUT: Tuple[int, ...] = tuple(255 - (255 * i) // PARTICLE_ALPHA_LEVELS for i in range(PARTICLE_ALPHA_LEVELS))
+
 # UI & System Configuration Constants
 DEFAULT_FONT: Optional[str] = None # Uses pygame's default font
 FONT_SIZES: Dict[str, int] = {
@@ -81,7 +94,12 @@ UI_SPACING: Dict[str, int] = {
     "health_display_y": 10,
 }
 
-SPATIAL_GRID_CELL_SIZE: int = 100 # Cell size for collision partitioning
+# Mixer channels reserved per sound effect; each effect round-robins over its own channels
+SOUND_RESERVED_CHANNELS: Dict[str, int] = {
+    "player_shot": 4,
+    "enemy_explosion": 3,
+    "player_hit": 1,
+}
 
 # --- Pygame Initialization (Moved to Game class) ---
 # pygame.init()
@@ -100,27 +118,42 @@ class EventManager:
     def __new__(cls) -> 'EventManager':
         if cls._instance is None:
             cls._instance = super(EventManager, cls).__new__(cls)
-            cls._instance._subscribers: Dict[str, List[Callable[[Any], None]]] = collections.defaultdict(list) # type: ignore
+            # Copy-on-write tuples: (un)subscribing replaces the tuple, so post can iterate it directly
+            cls._instance._subscribers: Dict[str, Tuple[Callable[[Any], None], ...]] = {} # type: ignore
         return cls._instance
 
     def subscribe(self, event_type: str, callback: Callable[[Any], None]) -> None:
         """Register a callback for an event type."""
-        if callback not in self._subscribers[event_type]:
-            self._subscribers[event_type].append(callback)
+        callbacks = self._subscribers.get(event_type, ())
+        if callback not in callbacks:
+            self._subscribers[event_type] = callbacks + (callback,)
 
     def unsubscribe(self, event_type: str, callback: Callable[[Any], None]) -> None:
         """Unregister a callback for an event type."""
-        if callback in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(callback)
+        callbacks = self._subscribers.get(event_type, ())
+        if callback in callbacks:
+            self._subscribers[event_type] = tuple(cb for cb in callbacks if cb != callback)
 
     def post(self, event_type: str, data: Any = None) -> None:
         """Notify all subscribers of an event."""
-        # Iterate over a copy to allow callbacks to unsubscribe themselves
-        for callback in list(self._subscribers[event_type]):
+        # The tuple is never mutated, so callbacks may (un)subscribe mid-dispatch without a per-post copy
+        for callback in self._subscribers.get(event_type, ()):
             callback(data)
 
 # EVENT_MANAGER: EventManager = EventManager() # Moved instantiation to Game class
 
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render anti-aliased text already converted to the display format, so blitting it needs no per-blit conversion."""
+    return font.render(text, True, color).convert_alpha()
+
+def blit_batch(screen: pygame.Surface, batch: List[Tuple[pygame.Surface, Any]]) -> None:
+    """Blit a sequence of (surface, dest) pairs in one call, without building the returned rect list."""
+    fblits = getattr(screen, "fblits", None) # pygame-ce only
+    if fblits is not None:
+        fblits(batch)
+    else:
+        screen.blits(batch, doreturn=False)
+
 T = TypeVar('T', bound='GameObject') # Type variable for GenericObjectPool
 
 class GenericObjectPool(Generic[T]): # Inherit from typing.Generic to make the class subscriptable
@@ -128,7 +161,9 @@ class GenericObjectPool(Generic[T]): # Inherit from typing.Generic to make the c
     def __init__(self, object_factory: Callable[[], T], initial_size: int = 10):
         self._object_factory: Callable[[], T] = object_factory
         self._pool: Deque[T] = collections.deque()
-        self._active_objects: List[T] = []
+        # Insertion-ordered dict used as an ordered set: O(1) membership and removal on return,
+        # while get_all_active keeps handing out objects in spawn order.
+        self._active_objects: Dict[T, None] = {}
         self.warmup(initial_size)
 
     def warmup(self, size: int) -> None:
@@ -145,14 +180,14 @@ class GenericObjectPool(Generic[T]): # Inherit from typing.Generic to make the c
             obj = self._pool.popleft()
         obj.reset()  # Reset object state before reuse
         obj.is_active = True
-        self._active_objects.append(obj)
+        self._active_objects[obj] = None
         return obj
 
     def return_obj(self, obj: T) -> None:
         """Return an object to the pool."""
         if obj in self._active_objects:
             obj.is_active = False
-            self._active_objects.remove(obj)
+            del self._active_objects[obj]
             self._pool.append(obj)
         else:
             # Object was not managed by this pool or already returned
@@ -164,15 +199,17 @@ class GenericObjectPool(Generic[T]): # Inherit from typing.Generic to make the c
 
 # --- Game Entities ---
 
-class GameObject(pygame.sprite.Sprite):
-    """Base class for all game entities."""
+class GameObject:
+    """Base class for all game entities.
+
+    Deliberately not a pygame.sprite.Sprite: entities live in object pools, collide through
+    CollisionManager and draw themselves, so Sprite's group bookkeeping would go unused.
+    """
     def __init__(self, image: Optional[pygame.Surface] = None, position: Optional[pygame.math.Vector2] = None,
                  velocity: Optional[pygame.math.Vector2] = None, collision_size: Optional[Tuple[int, int]] = None):
-        super().__init__()
-        
-        # Ensure image is always a surface with alpha support
+        # Per-pixel alpha images keep alpha; opaque/colorkey images stay on the faster non-alpha blit path
         if image:
-            self.original_image: pygame.Surface = image.convert_alpha()
+            self.original_image: pygame.Surface = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
         elif collision_size:
             self.original_image = pygame.Surface(collision_size, pygame.SRCALPHA).convert_alpha()
             self.original_image.fill((0, 0, 0, 0)) # Start transparent
@@ -222,10 +259,12 @@ class Player(GameObject):
         self.fire_cooldown_timer: float = 0.0 # Time since last shot
         self.bullet_pool: GenericObjectPool[Bullet] = bullet_pool
         self.sound_manager: 'SoundManager' = sound_manager
+        self.held_move_keys: Set[int] = set() # Movement keys currently down, tracked from KEYDOWN/KEYUP events
 
     def _create_player_image(self) -> pygame.Surface:
         """Create a simple polygonal image for the player."""
-        img = pygame.Surface(PLAYER_COLLISION_BOX_SIZE, pygame.SRCALPHA).convert_alpha()
+        img = pygame.Surface(PLAYER_COLLISION_BOX_SIZE).convert()
+        img.fill(SPRITE_COLORKEY)
         points = [
             (PLAYER_COLLISION_BOX_SIZE[0] // 2, 0),
             (0, PLAYER_COLLISION_BOX_SIZE[1]),
@@ -233,6 +272,7 @@ class Player(GameObject):
         ]
         pygame.draw.polygon(img, BLUE, points)
         pygame.draw.rect(img, LIGHT_GREY, (PLAYER_COLLISION_BOX_SIZE[0] // 2 - 5, int(PLAYER_COLLISION_BOX_SIZE[1] * 0.7), 10, 20))
+        img.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
         return img
 
     def update(self, dt: float) -> None:
@@ -243,12 +283,13 @@ class Player(GameObject):
         self.fire_cooldown_timer += dt # Accumulate dt for fire rate
 
         # Handle movement input
-        keys = pygame.key.get_pressed()
+        held = self.held_move_keys
         self.velocity.x = 0.0 # Reset velocity each frame, then apply input
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            self.velocity.x = -self.speed
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            self.velocity.x = self.speed
+        if held:
+            if PLAYER_LEFT_KEYS[0] in held or PLAYER_LEFT_KEYS[1] in held:
+                self.velocity.x = -self.speed
+            elif PLAYER_RIGHT_KEYS[0] in held or PLAYER_RIGHT_KEYS[1] in held:
+                self.velocity.x = self.speed
 
         super().update(dt)  # Apply velocity
 
@@ -260,6 +301,14 @@ class Player(GameObject):
             self.rect.right = SCREEN_WIDTH
             self.position.x = float(self.rect.centerx)
 
+    def handle_key(self, event: pygame.event.Event) -> None:
+        """Track movement keys from KEYDOWN/KEYUP events instead of polling the keyboard every frame."""
+        if event.key in PLAYER_LEFT_KEYS or event.key in PLAYER_RIGHT_KEYS:
+            if event.type == pygame.KEYDOWN:
+                self.held_move_keys.add(event.key)
+            else:
+                self.held_move_keys.discard(event.key)
+
     def shoot(self) -> None:
         """Handle player shooting logic."""
         if self.fire_cooldown_timer >= self.fire_rate:
@@ -287,6 +336,9 @@ class Player(GameObject):
         self.position = PLAYER_START_POS.copy()
         self.health = self.max_health
         self.fire_cooldown_timer = 0.0
+        # Key events seen by other states were not forwarded here, so resync once from the keyboard
+        keys = pygame.key.get_pressed()
+        self.held_move_keys = {key for key in PLAYER_LEFT_KEYS + PLAYER_RIGHT_KEYS if keys[key]}
         self.is_active = True  # Player is always active in PlayState initially
         self.rect.center = (int(self.position.x), int(self.position.y))
 
@@ -300,7 +352,7 @@ class Bullet(GameObject):
 
     def _create_bullet_image(self) -> pygame.Surface:
         """Create a simple rectangular image for the bullet."""
-        img = pygame.Surface(BULLET_COLLISION_BOX_SIZE, pygame.SRCALPHA).convert_alpha()
+        img = pygame.Surface(BULLET_COLLISION_BOX_SIZE).convert() # Fully opaque, needs no colorkey
         pygame.draw.rect(img, YELLOW, (0, 0, BULLET_COLLISION_BOX_SIZE[0], BULLET_COLLISION_BOX_SIZE[1]))
         return img
 
@@ -335,13 +387,15 @@ class Enemy(GameObject):
 
     def _create_enemy_image(self) -> pygame.Surface:
         """Create a simple polygonal image for the enemy."""
-        img = pygame.Surface(ENEMY_COLLISION_BOX_SIZE, pygame.SRCALPHA).convert_alpha()
+        img = pygame.Surface(ENEMY_COLLISION_BOX_SIZE).convert()
+        img.fill(SPRITE_COLORKEY)
         points = [
             (ENEMY_COLLISION_BOX_SIZE[0] // 2, ENEMY_COLLISION_BOX_SIZE[1]),
             (0, 0),
             (ENEMY_COLLISION_BOX_SIZE[0], 0)
         ]
         pygame.draw.polygon(img, RED, points)
+        img.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
         return img
 
     def update(self, dt: float) -> None:
@@ -375,18 +429,39 @@ class Enemy(GameObject):
 
 class Particle(GameObject):
     """A single particle for effects like explosions."""
+    # Fade frames shared by every particle of the same (size, color), one surface per PARTICLE_ALPHA_LUT step
+    _fade_frames: Dict[Tuple[int, Tuple[int, int, int]], Tuple[pygame.Surface, ...]] = {}
+
     def __init__(self, size: int, color: Tuple[int, int, int]):
-        # Create a base image for the particle once
-        particle_image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
-        pygame.draw.circle(particle_image, color, (size, size), size)
-        super().__init__(image=particle_image, collision_size=(size * 2, size * 2))
+        fade_frames = self._get_fade_frames(size, color)
+        super().__init__(collision_size=(size * 2, size * 2))
+        self.fade_frames: Tuple[pygame.Surface, ...] = fade_frames
+        self.original_image = fade_frames[0]
+        self.image = self.original_image
 
         self.initial_color: Tuple[int, int, int] = color
         self.lifetime: float = 0.0
         self.age: float = 0.0
         self.current_alpha: int = 255
+        self.alpha_step: int = 0  # Index into PARTICLE_ALPHA_LUT last applied to the image
         self.base_size: int = size
 
+    @classmethod
+    def _get_fade_frames(cls, size: int, color: Tuple[int, int, int]) -> Tuple[pygame.Surface, ...]:
+        """Render the circle once per (size, color) and keep a pre-faded copy for each alpha step."""
+        key = (size, color)
+        frames = cls._fade_frames.get(key)
+        if frames is None:
+            base_image = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(base_image, color, (size, size), size)
+            faded: List[pygame.Surface] = []
+            for alpha in PARTICLE_ALPHA_LUT:
+                frame = base_image.copy()
+                frame.set_alpha(alpha)
+                faded.append(frame)
+            frames = cls._fade_frames[key] = tuple(faded)
+        return frames
+
     def update(self, dt: float) -> None:
         """Update particle position and age, and calculate alpha."""
         super().update(dt)
@@ -397,7 +472,10 @@ class Particle(GameObject):
         normalized_age: float = self.age / self.lifetime
         self.current_alpha = max(0, 255 - int(255 * normalized_age))
         if self.current_alpha > 0:
-            self.image.set_alpha(self.current_alpha)
+            alpha_step = min(PARTICLE_ALPHA_LEVELS - 1, int(normalized_age * PARTICLE_ALPHA_LEVELS))
+            if alpha_step != self.alpha_step:
+                self.alpha_step = alpha_step
+                self.image = self.fade_frames[alpha_step]
         else:
             self.is_active = False
 
@@ -412,74 +490,28 @@ class Particle(GameObject):
         self.lifetime = 0.0
         self.age = 0.0
         self.current_alpha = 255
-        self.image.set_alpha(255)
+        self.alpha_step = 0  # super().reset() restored image to the first (opaque) fade frame
 
 # --- Game Systems ---
 
-class SpatialGrid:
-    """A spatial partitioning system for optimized collision detection."""
-    def __init__(self, width: int, height: int, cell_size: int):
-        self.width: int = width
-        self.height: int = height
-        self.cell_size: int = cell_size
-        self.grid_cols: int = math.ceil(width / cell_size)
-        self.grid_rows: int = math.ceil(height / cell_size)
-        self.grid: List[List[List[GameObject]]] = [[[] for _ in range(self.grid_cols)] for _ in range(self.grid_rows)]
-
-    def _get_cells(self, rect: pygame.Rect) -> Tuple[int, int, int, int]:
-        """Determine which grid cells an object's bounding box occupies."""
-        min_col = max(0, int(rect.left // self.cell_size))
-        max_col = min(self.grid_cols - 1, int(rect.right // self.cell_size))
-        min_row = max(0, int(rect.top // self.cell_size))
-        max_row = min(self.grid_rows - 1, int(rect.bottom // self.cell_size))
-        return min_col, max_col, min_row, max_row
-
-    def add_object(self, obj: GameObject) -> None:
-        """Add an active object to the grid."""
-        if not obj.is_active: return
-        min_col, max_col, min_row, max_row = self._get_cells(obj.rect)
-        for row in range(min_row, max_row + 1):
-            for col in range(min_col, max_col + 1):
-                self.grid[row][col].append(obj)
-
-    def clear(self) -> None:
-        """Clear all objects from the grid (to be called each frame)."""
-        for row in range(self.grid_rows):
-            for col in range(self.grid_cols):
-                self.grid[row][col].clear()
-
-    def get_nearby_objects(self, obj: GameObject) -> Set[GameObject]:
-        """Get a set of potential colliders for a given object."""
-        if not obj.is_active: return set()
-        nearby: Set[GameObject] = set()
-        min_col, max_col, min_row, max_row = self._get_cells(obj.rect)
-        # Check object's own cells and adjacent cells
-        for row in range(max(0, min_row - 1), min(self.grid_rows, max_row + 2)):
-            for col in range(max(0, min_col - 1), min(self.grid_cols, max_col + 2)):
-                for potential_collider in self.grid[row][col]:
-                    if potential_collider != obj and potential_collider.is_active:
-                        nearby.add(potential_collider)
-        return nearby
-
 class CollisionManager:
-    """Manages collision detection using a spatial grid."""
-    def __init__(self, spatial_grid: SpatialGrid):
-        self.spatial_grid: SpatialGrid = spatial_grid
-
+    """Manages collision detection between groups of game objects."""
     def check_collisions_between_groups(self, group1: List[GameObject], group2: List[GameObject]) -> List[Tuple[GameObject, GameObject]]:
         """
-        Checks for collisions between objects in group1 and group2,
-        leveraging the spatial grid for efficiency.
+        Checks for collisions between objects in group1 and group2.
+        Each group1 object tests against all group2 rects in one Rect.collidelistall call, so the
+        pairwise scan runs in C; at this game's entity counts that beats any Python-side partitioning.
         Returns a list of (obj1, obj2) tuples that have collided.
         """
         collided_pairs: List[Tuple[GameObject, GameObject]] = []
-        group2_set: Set[GameObject] = set(group2)
+        targets = [obj2 for obj2 in group2 if obj2.is_active]
+        if not targets:
+            return collided_pairs
+        target_rects = [obj2.rect for obj2 in targets]
         for obj1 in group1:
             if not obj1.is_active: continue
-            potential_colliders = self.spatial_grid.get_nearby_objects(obj1)
-            for obj2 in potential_colliders:
-                if obj2 in group2_set and obj2.is_active and obj1.rect.colliderect(obj2.rect):
-                    collided_pairs.append((obj1, obj2))
+            for index in obj1.rect.collidelistall(target_rects):
+                collided_pairs.append((obj1, targets[index]))
         return collided_pairs
 
 class CombatSystem:
@@ -527,6 +559,9 @@ class ScoreSystem:
     def __init__(self, event_manager: EventManager):
         self.score: int = 0
         self.font: pygame.font.Font = pygame.font.Font(DEFAULT_FONT, FONT_SIZES["score_health"])
+        # Rendered text is cached and only re-rasterized when the displayed score changes
+        self._rendered_score: Optional[int] = None
+        self._score_surface: Optional[pygame.Surface] = None
         self.event_manager: EventManager = event_manager
         self.event_manager.subscribe("ENEMY_DESTROYED", self._on_enemy_destroyed)
 
@@ -546,33 +581,53 @@ class ScoreSystem:
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the current score on the screen."""
-        score_text = self.font.render(f"Score: {self.score}", True, UI_COLORS["main_text"])
-        screen.blit(score_text, (UI_SPACING["score_display_x"], UI_SPACING["score_display_y"]))
+        if self._score_surface is None or self._rendered_score != self.score:
+            self._score_surface = render_text(self.font, f"Score: {self.score}", UI_COLORS["main_text"])
+            self._rendered_score = self.score
+        screen.blit(self._score_surface, (UI_SPACING["score_display_x"], UI_SPACING["score_display_y"]))
 
 class HealthSystem:
     """Manages and displays the player's health."""
     def __init__(self, player: Player):
         self.player: Player = player
         self.font: pygame.font.Font = pygame.font.Font(DEFAULT_FONT, FONT_SIZES["score_health"])
+        # Rendered text and its right-aligned position are cached per (health, max_health)
+        self._rendered_health: Optional[Tuple[int, int]] = None
+        self._health_surface: Optional[pygame.Surface] = None
+        self._health_pos: Tuple[int, int] = (0, 0)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the player's current health on the screen."""
-        color = UI_COLORS["health_good"] if self.player.health > 1 else UI_COLORS["health_bad"]
-        health_text = self.font.render(f"HP: {self.player.health}/{self.player.max_health}", True, color)
-        screen.blit(health_text, (SCREEN_WIDTH - health_text.get_width() - UI_SPACING["health_display_x_offset"], UI_SPACING["health_display_y"]))
+        health_key = (self.player.health, self.player.max_health)
+        if self._health_surface is None or self._rendered_health != health_key:
+            color = UI_COLORS["health_good"] if self.player.health > 1 else UI_COLORS["health_bad"]
+            self._health_surface = render_text(self.font, f"HP: {self.player.health}/{self.player.max_health}", color)
+            self._health_pos = (SCREEN_WIDTH - self._health_surface.get_width() - UI_SPACING["health_display_x_offset"],
+                                UI_SPACING["health_display_y"])
+            self._rendered_health = health_key
+        screen.blit(self._health_surface, self._health_pos)
 
 class ParallaxBackground:
     """Creates a multi-layered scrolling starfield background."""
     def __init__(self, screen_size: Tuple[int, int], speeds: List[int]):
         self.screen_size: Tuple[int, int] = screen_size
         self.layers: List[Dict[str, Any]] = []
+        width, height = screen_size
         for i, speed in enumerate(speeds):
             layer_image = self._create_star_field(screen_size, num_stars=100 * (i + 1), star_size=i + 1)
+            # Two stacked copies let a single blit cover the screen at any scroll offset.
+            # Stars are fully opaque on a transparent field, so an opaque surface with a black
+            # colorkey draws the same pixels through pygame's cheaper colorkey blitter.
+            tall_image = pygame.Surface((width, height * 2)).convert()
+            tall_image.fill(BLACK)
+            tall_image.blit(layer_image, (0, 0))
+            tall_image.blit(layer_image, (0, height))
+            tall_image.set_colorkey(BLACK, pygame.RLEACCEL)
             self.layers.append({
                 "image": layer_image,
+                "tall_image": tall_image,
                 "speed": float(speed),
-                "y": 0.0,
-                "y2": float(-screen_size[1])
+                "y": 0.0
             })
 
     def _create_star_field(self, size: Tuple[int, int], num_stars: int, star_size: int) -> pygame.Surface:
@@ -588,24 +643,27 @@ class ParallaxBackground:
 
     def update(self, dt: float) -> None:
         """Update background layer positions for scrolling."""
+        height = self.screen_size[1]
         for layer in self.layers:
-            layer["y"] += layer["speed"] * dt
-            layer["y2"] += layer["speed"] * dt
-            if layer["y"] >= self.screen_size[1]:
-                layer["y"] = layer["y2"] - self.screen_size[1]
-            if layer["y2"] >= self.screen_size[1]:
-                layer["y2"] = layer["y"] - self.screen_size[1]
+            layer["y"] = (layer["y"] + layer["speed"] * dt) % height
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the background layers to the screen."""
+        height = self.screen_size[1]
         for layer in self.layers:
-            screen.blit(layer["image"], (0, int(layer["y"])))
-            screen.blit(layer["image"], (0, int(layer["y2"])))
+            screen.blit(layer["tall_image"], (0, int(layer["y"]) - height))
 
 class ParticleSystem:
     """Manages and renders visual particle effects (e.g., explosions)."""
     def __init__(self, event_manager: EventManager):
         self._active_particles: List[Particle] = []
+        # One pool per (size, color) look: a particle's surface is fixed at creation and only its
+        # alpha changes, so recycled particles never need a new Surface or circle draw.
+        self._particle_pools: Dict[Tuple[int, Tuple[int, int, int]], GenericObjectPool[Particle]] = {}
+        for size in PARTICLE_SIZES:
+            for color in PARTICLE_COLORS:
+                self._particle_pools[(size, color)] = GenericObjectPool(
+                    lambda size=size, color=color: Particle(size, color), initial_size=PARTICLE_POOL_WARMUP)
         self.event_manager: EventManager = event_manager
         self.event_manager.subscribe("ENEMY_DESTROYED", self._on_enemy_destroyed)
 
@@ -616,7 +674,8 @@ class ParticleSystem:
     def add_explosion(self, position: pygame.math.Vector2) -> None:
         """Add a new explosion effect at a given position."""
         for _ in range(random.randint(5, 15)):
-            particle = Particle(size=random.randint(2, 5), color=random.choice([RED, YELLOW, ORANGE]))
+            size: int = random.randint(PARTICLE_SIZES[0], PARTICLE_SIZES[-1])
+            particle = self._particle_pools[(size, random.choice(PARTICLE_COLORS))].get()
             
             speed: float = random.uniform(50, 150)
             angle: float = random.uniform(0, 2 * math.pi)
@@ -626,7 +685,6 @@ class ParticleSystem:
             particle.position = position.copy()
             particle.velocity = velocity
             particle.lifetime = lifetime
-            particle.is_active = True
             self._active_particles.append(particle)
 
     def update(self, dt: float) -> None:
@@ -636,15 +694,20 @@ class ParticleSystem:
             p.update(dt)
             if p.is_active:
                 particles_to_keep.append(p)
+            else:
+                self._particle_pools[(p.base_size, p.initial_color)].return_obj(p)
         self._active_particles = particles_to_keep
 
     def draw(self, screen: pygame.Surface) -> None:
-        """Draw active particles to the screen."""
-        for p in self._active_particles:
-            p.draw(screen)
+        """Draw active particles to the screen in a single batched blit call."""
+        batch = [(p.image, p.rect) for p in self._active_particles if p.is_active and p.current_alpha > 0]
+        if batch:
+            blit_batch(screen, batch)
 
     def reset(self) -> None:
-        """Clears all active particles."""
+        """Clears all active particles, returning them to their pools."""
+        for p in self._active_particles:
+            self._particle_pools[(p.base_size, p.initial_color)].return_obj(p)
         self._active_particles.clear()
 
 class SoundManager:
@@ -659,6 +722,7 @@ class SoundManager:
             cls._instance.load_sound("player_shot", "assets/player_shot.wav")
             cls._instance.load_sound("enemy_explosion", "assets/enemy_explosion.wav")
             cls._instance.load_sound("player_hit", "assets/player_hit.wav")
+            cls._instance._reserve_channels()
             # The sound manager needs access to the EventManager to post events like "PLAYER_DIED"
             # However, direct access should ideally be through dependency injection or GameContext.
             # For now, if EventManager is also a singleton, we can get its instance directly here.
@@ -668,6 +732,20 @@ class SoundManager:
             cls._instance.event_manager: Optional[EventManager] = None # type: ignore # Will be set by Game class
         return cls._instance
 
+    def _reserve_channels(self) -> None:
+        """Reserve dedicated mixer channels per effect so play_sound never has to search for a free one."""
+        reserved_total = sum(SOUND_RESERVED_CHANNELS.values())
+        # Add the reserved channels on top of the existing ones, which stay free for find_channel() fallbacks
+        pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + reserved_total)
+        pygame.mixer.set_reserved(reserved_total)
+        self._channels: Dict[str, List[pygame.mixer.Channel]] = {}
+        self._next_channel: Dict[str, int] = {}
+        first_id = 0
+        for name, count in SOUND_RESERVED_CHANNELS.items():
+            self._channels[name] = [pygame.mixer.Channel(first_id + i) for i in range(count)]
+            self._next_channel[name] = 0
+            first_id += count
+
     def set_event_manager(self, event_manager: EventManager) -> None:
         """Sets the event manager for this SoundManager instance."""
         self.event_manager = event_manager
@@ -677,18 +755,26 @@ class SoundManager:
         try:
             self._sounds[name] = pygame.mixer.Sound(path)
         except (pygame.error, FileNotFoundError): # Catch both pygame.error and FileNotFoundError
-            print(f"Warning: Could not load sound '{path}'. Using silent placeholder.")
+            logger.warning("Could not load sound '%s'. Using silent placeholder.", path)
             self._sounds[name] = pygame.mixer.Sound(buffer=b'\x00' * 8) 
 
     def play_sound(self, name: str, loops: int = 0, volume: float = 1.0) -> None:
         """Play a loaded sound."""
-        if name in self._sounds:
-            channel = pygame.mixer.find_channel(True)
+        sound = self._sounds.get(name)
+        if sound is not None:
+            channels = self._channels.get(name)
+            if channels:
+                # Round-robin over this effect's reserved channels; the oldest instance is cut off when all are busy
+                index = self._next_channel[name]
+                self._next_channel[name] = (index + 1) % len(channels)
+                channel = channels[index]
+            else:
+                channel = pygame.mixer.find_channel(True)
             if channel:
                 channel.set_volume(volume)
-                channel.play(self._sounds[name], loops)
+                channel.play(sound, loops)
         else:
-            print(f"Warning: Sound '{name}' not found or not loaded.")
+            logger.warning("Sound '%s' not found or not loaded.", name)
 
 # SOUND_MANAGER: SoundManager = SoundManager() # Moved instantiation to Game class
 
@@ -715,6 +801,13 @@ class GameContextProtocol(Protocol):
     
     def quit_game(self) -> None: ...
 
+def _render_option_variants(font: pygame.font.Font, text: str, center: Tuple[int, int]
+                            ) -> Tuple[Tuple[pygame.Surface, pygame.Rect], Tuple[pygame.Surface, pygame.Rect]]:
+    """Pre-render a menu option in its normal and highlighted colors, both centered on `center`."""
+    normal = render_text(font, text, UI_COLORS["normal_text"])
+    highlighted = render_text(font, text, UI_COLORS["highlight_text"])
+    return (normal, normal.get_rect(center=center)), (highlighted, highlighted.get_rect(center=center))
+
 class BaseGameState:
     """Abstract base class for all game states."""
     def __init__(self, state_manager: 'StateManager'):
@@ -722,6 +815,10 @@ class BaseGameState:
         self.game_context: Optional[GameContextProtocol] = None
         self.event_manager: Optional[EventManager] = None # Added for convenience in states
         self.sound_manager: Optional['SoundManager'] = None # Changed type hint here
+        # Static screens only repaint what changed: a full redraw after enter()/invalidate(), then dirty rects
+        self.needs_full_redraw: bool = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._blit_sequence: List[Tuple[pygame.Surface, pygame.Rect]] = []
 
     def set_game_context(self, context: GameContextProtocol) -> None:
         """Sets the game context (e.g., the main Game instance) for the state."""
@@ -742,9 +839,45 @@ class BaseGameState:
         """Updates the game logic for this state."""
         pass
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draws the screen for this state."""
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draws the screen for this state. Returns the areas that changed, or None if the whole screen did."""
         screen.fill(BLACK) # Default background
+        return None
+
+    def invalidate(self) -> None:
+        """Force the next draw to repaint the whole screen (e.g. on entering the state or a window expose)."""
+        self.needs_full_redraw = True
+        self._dirty_rects = []
+
+    def _set_blit_sequence(self, blits: List[Tuple[pygame.Surface, pygame.Rect]]) -> None:
+        """Replace the cached blits, marking the rects of any entries that changed as dirty."""
+        old_blits = self._blit_sequence
+        if len(old_blits) != len(blits):
+            self.needs_full_redraw = True
+        else:
+            for old_entry, new_entry in zip(old_blits, blits):
+                if old_entry is not new_entry:
+                    self._dirty_rects.append(old_entry[1].union(new_entry[1]))
+        self._blit_sequence = blits
+
+    def _draw_cached(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Draw the cached blit sequence, repainting only the dirty rects unless a full redraw is due."""
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            self._dirty_rects = []
+            BaseGameState.draw(self, screen)
+            blit_batch(screen, self._blit_sequence)
+            return None
+        dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+        if dirty_rects:
+            for rect in dirty_rects:
+                # Clip so anti-aliased text overlapping the rect isn't blended over itself outside it
+                screen.set_clip(rect)
+                screen.fill(BLACK)
+                blit_batch(screen, [entry for entry in self._blit_sequence if entry[1].colliderect(rect)])
+            screen.set_clip(None)
+        return dirty_rects
 
     def exit(self) -> None:
         """Called when exiting this state."""
@@ -774,26 +907,31 @@ class IntroState(BaseGameState):
             "",
             "按任意鍵進入主選單"
         ]
+        self._set_blit_sequence(self._render_rules())
 
-    def handle_input(self, event: pygame.event.Event) -> None:
-        if event.type == pygame.KEYDOWN:
-            self.state_manager.set_state(GameState.MAIN_MENU)
-
-    def draw(self, screen: pygame.Surface) -> None:
-        super().draw(screen)
+    def _render_rules(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render every rules line once, with its final screen position."""
+        rendered: List[Tuple[pygame.Surface, pygame.Rect]] = []
         y_offset: int = 100
         for i, line in enumerate(self.rules_text):
             if i == 0:
-                text_surface = self.intro_font_large.render(line, True, UI_COLORS["title"])
+                text_surface = render_text(self.intro_font_large, line, UI_COLORS["title"])
             elif i < 3:
-                text_surface = self.intro_font_medium.render(line, True, UI_COLORS["main_text"])
+                text_surface = render_text(self.intro_font_medium, line, UI_COLORS["main_text"])
             else:
-                text_surface = self.intro_font_small.render(line, True, UI_COLORS["normal_text"])
-            text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(text_surface, text_rect)
+                text_surface = render_text(self.intro_font_small, line, UI_COLORS["normal_text"])
+            rendered.append((text_surface, text_surface.get_rect(center=(SCREEN_WIDTH // 2, y_offset))))
             y_offset += text_surface.get_height() + UI_SPACING["line_height_small"]
             if i == 0: y_offset += UI_SPACING["line_height_large"]
             if i == 2: y_offset += UI_SPACING["line_height_medium"]
+        return rendered
+
+    def handle_input(self, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            self.state_manager.set_state(GameState.MAIN_MENU)
+
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        return self._draw_cached(screen)
 
 class MainMenuState(BaseGameState):
     def __init__(self, state_manager: 'StateManager'):
@@ -802,18 +940,31 @@ class MainMenuState(BaseGameState):
         self.menu_font_options: pygame.font.Font
         self.selected_option: int = 0
         self.options: List[str] = ["開始遊戲", "離開"]
+        # Rendered once per enter(); each option keeps a (normal, highlighted) pair of (surface, rect)
+        self._title: Tuple[pygame.Surface, pygame.Rect]
+        self._option_variants: List[Tuple[Tuple[pygame.Surface, pygame.Rect], Tuple[pygame.Surface, pygame.Rect]]] = []
 
     def enter(self) -> None:
         self.menu_font_title = pygame.font.Font(None, FONT_SIZES["title"])
         self.menu_font_options = pygame.font.Font(None, FONT_SIZES["options"])
         self.selected_option = 0
+        title_text = render_text(self.menu_font_title, "星際突襲者", UI_COLORS["title"])
+        self._title = (title_text, title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)))
+        self._option_variants = [
+            _render_option_variants(self.menu_font_options, option,
+                                    (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * UI_SPACING["menu_option_gap"]))
+            for i, option in enumerate(self.options)
+        ]
+        self._build_blit_sequence()
 
     def handle_input(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
                 self.selected_option = (self.selected_option - 1) % len(self.options)
+                self._build_blit_sequence()
             elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
                 self.selected_option = (self.selected_option + 1) % len(self.options)
+                self._build_blit_sequence()
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 if self.selected_option == 0:
                     self.state_manager.set_state(GameState.PLAYING)
@@ -821,17 +972,15 @@ class MainMenuState(BaseGameState):
                     if self.game_context:
                         self.game_context.quit_game()
 
-    def draw(self, screen: pygame.Surface) -> None:
-        super().draw(screen)
-        title_text = self.menu_font_title.render("星際突襲者", True, UI_COLORS["title"])
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-        screen.blit(title_text, title_rect)
+    def _build_blit_sequence(self) -> None:
+        """Assemble this frame's blits; only needed again when the selection changes."""
+        self._set_blit_sequence([self._title] + [
+            highlighted if i == self.selected_option else normal
+            for i, (normal, highlighted) in enumerate(self._option_variants)
+        ])
 
-        for i, option in enumerate(self.options):
-            color = UI_COLORS["highlight_text"] if i == self.selected_option else UI_COLORS["normal_text"]
-            option_text = self.menu_font_options.render(option, True, color)
-            option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * UI_SPACING["menu_option_gap"]))
-            screen.blit(option_text, option_rect)
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        return self._draw_cached(screen)
 
 class PlayScene:
     """Encapsulates all game logic and entities for the PLAYING state."""
@@ -849,8 +998,7 @@ class PlayScene:
         self.particle_system: ParticleSystem = ParticleSystem(self.event_manager)
         self.score_system: ScoreSystem = score_system
         self.health_system: HealthSystem = HealthSystem(self.player)
-        self.spatial_grid: SpatialGrid = SpatialGrid(SCREEN_WIDTH, SCREEN_HEIGHT, cell_size=SPATIAL_GRID_CELL_SIZE)
-        self.collision_manager: CollisionManager = CollisionManager(self.spatial_grid)
+        self.collision_manager: CollisionManager = CollisionManager()
         self.combat_system: CombatSystem = CombatSystem(self.player, bullet_pool, enemy_pool, self.event_manager, self.sound_manager)
 
         # Entity and Spawning Managers
@@ -870,6 +1018,10 @@ class PlayScene:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE and self.player.is_active:
                 self.player.shoot()
+            else:
+                self.player.handle_key(event)
+        elif event.type == pygame.KEYUP:
+            self.player.handle_key(event)
 
     def update(self, dt: float) -> None:
         """Updates all game logic and entities for the PLAYING state."""
@@ -879,14 +1031,7 @@ class PlayScene:
         self.game_entity_manager.update_and_recycle(dt)
         self.particle_system.update(dt)
 
-        self.spatial_grid.clear()
-        if self.player.is_active:
-            self.spatial_grid.add_object(self.player)
-        for bullet in self.game_entity_manager.get_all_active_bullets():
-            self.spatial_grid.add_object(bullet)
-        for enemy in self.game_entity_manager.get_all_active_enemies():
-            self.spatial_grid.add_object(enemy)
-
+        # Fetch the active lists once; both collision queries share them
         active_bullets = self.game_entity_manager.get_all_active_bullets()
         active_enemies = self.game_entity_manager.get_all_active_enemies()
 
@@ -954,6 +1099,10 @@ class GameOverState(BaseGameState):
         self.final_score: int = 0
         self.selected_option: int = 0
         self.options: List[str] = ["重新開始", "返回主選單"]
+        # Rendered once per enter() (the score is fixed while this state is shown)
+        self._title: Tuple[pygame.Surface, pygame.Rect]
+        self._score: Tuple[pygame.Surface, pygame.Rect]
+        self._option_variants: List[Tuple[Tuple[pygame.Surface, pygame.Rect], Tuple[pygame.Surface, pygame.Rect]]] = []
 
     def enter(self) -> None:
         self.game_over_font_title = pygame.font.Font(None, FONT_SIZES["title"])
@@ -964,33 +1113,40 @@ class GameOverState(BaseGameState):
             self.final_score = self.game_context.score_system.score
         self.selected_option = 0
 
+        game_over_text = render_text(self.game_over_font_title, "遊戲結束", UI_COLORS["health_bad"])
+        self._title = (game_over_text, game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4)))
+        score_text = render_text(self.game_over_font_score, f"最終得分: {self.final_score}", UI_COLORS["main_text"])
+        self._score = (score_text, score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + UI_SPACING["game_over_score_offset_y"])))
+        self._option_variants = [
+            _render_option_variants(self.game_over_font_options, option,
+                                    (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * UI_SPACING["menu_option_gap"] + UI_SPACING["game_over_options_offset_y"]))
+            for i, option in enumerate(self.options)
+        ]
+        self._build_blit_sequence()
+
     def handle_input(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_UP or event.key == pygame.K_w:
                 self.selected_option = (self.selected_option - 1) % len(self.options)
+                self._build_blit_sequence()
             elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
                 self.selected_option = (self.selected_option + 1) % len(self.options)
+                self._build_blit_sequence()
             elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                 if self.selected_option == 0:
                     self.state_manager.set_state(GameState.PLAYING)
                 elif self.selected_option == 1:
                     self.state_manager.set_state(GameState.MAIN_MENU)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        super().draw(screen)
-        game_over_text = self.game_over_font_title.render("遊戲結束", True, UI_COLORS["health_bad"])
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4))
-        screen.blit(game_over_text, game_over_rect)
-
-        score_text = self.game_over_font_score.render(f"最終得分: {self.final_score}", True, UI_COLORS["main_text"])
-        score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + UI_SPACING["game_over_score_offset_y"]))
-        screen.blit(score_text, score_rect)
+    def _build_blit_sequence(self) -> None:
+        """Assemble this frame's blits; only needed again when the selection changes."""
+        self._set_blit_sequence([self._title, self._score] + [
+            highlighted if i == self.selected_option else normal
+            for i, (normal, highlighted) in enumerate(self._option_variants)
+        ])
 
-        for i, option in enumerate(self.options):
-            color = UI_COLORS["highlight_text"] if i == self.selected_option else UI_COLORS["normal_text"]
-            option_text = self.game_over_font_options.render(option, True, color)
-            option_rect = option_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + i * UI_SPACING["menu_option_gap"] + UI_SPACING["game_over_options_offset_y"]))
-            screen.blit(option_text, option_rect)
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        return self._draw_cached(screen)
 
 class StateManager:
     """Manages the overall game state transitions and logic."""
@@ -1017,12 +1173,14 @@ class StateManager:
         if self._current_state and type(self._current_state) is type(self._states[new_state_enum]):
             return
 
-        print(f"Transitioning from {self._current_state.__class__.__name__ if self._current_state else 'None'} to {new_state_enum.name}")
+        # %-style args: the message is only formatted when debug logging is enabled
+        logger.debug("Transitioning from %s to %s", type(self._current_state).__name__ if self._current_state else None, new_state_enum.name)
         if self._current_state:
             self._current_state.exit()
 
         self._current_state = self._states[new_state_enum]
         self._current_state.enter()
+        self._current_state.invalidate()
 
     def handle_input(self, event: pygame.event.Event) -> None:
         """Passes input events to the current state's handler."""
@@ -1034,10 +1192,16 @@ class StateManager:
         if self._current_state:
             self._current_state.update(dt)
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Calls the current state's draw method."""
+    def draw(self, screen: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        """Calls the current state's draw method. Returns the changed areas, or None for the whole screen."""
+        if self._current_state:
+            return self._current_state.draw(screen)
+        return None
+
+    def invalidate(self) -> None:
+        """Forces the current state to repaint the whole screen on its next draw."""
         if self._current_state:
-            self._current_state.draw(screen)
+            self._current_state.invalidate()
 
 class EnemySpawnManager:
     """Manages the spawning of enemies based on time and difficulty."""
@@ -1151,6 +1315,8 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.is_running = False
+            elif event.type == pygame.WINDOWEXPOSED or event.type == pygame.VIDEOEXPOSE:
+                self.state_manager.invalidate() # Window contents may have been lost
             self.state_manager.handle_input(event)
 
     def run(self) -> None:
@@ -1160,9 +1326,12 @@ class Game:
 
             self.handle_input()
             self.state_manager.update(dt)
-            self.state_manager.draw(self.screen) # Pass self.screen
+            dirty_rects = self.state_manager.draw(self.screen) # Pass self.screen
 
-            pygame.display.flip()
+            if dirty_rects is None:
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
 
         pygame.quit()
 
@@ -76,31 +76,5 @@ def test_abstract():
     skeleton = abstract_program(src_code)
     print(skeleton)
 
-def run_fuzz_test(target_path_arg = None):
-    """
-    Executes Fuzzer test and returns a dictionary compatible with game_creator format.
-    Returns:
-        dict: {"state": bool, "Text": str}
-    """
-
-    # 1. Path resolution
-    base_dir    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    debug_dir   = os.path.join(base_dir, "Debug")
-    dest_dir    = os.path.join(base_dir, "dest")
-    
-    # Smart target selection: Priority given to debug_launcher
-    launcher_path = os.path.join(debug_dir, "debug_launcher.py")
-    target_script = ""
-
-    if os.path.exists(launcher_path):
-        target_script = launcher_path
-    elif target_path_arg and os.path.exists(target_path_arg):
-        target_script = target_path_arg
-    else:
-        target_script = os.path.join(dest_dir, "generated_app.py")
-
-    print(f"🎯 Fuzzer Target Script: {target_script}")
-
 if __name__ == "__main__":
     test_abstract()
-    #run_fuzz_test()
@@ -2,7 +2,6 @@ import os
 import re
 import time
 import random
-from google import genai
 from google.genai import types      #type: ignore
 from toolbox.config import *
 
@@ -49,22 +48,18 @@ def get_clean_json(raw_text: str) -> str:
     return content
 
 
-client = genai.Client(api_key=API_KEY)
+# `client` comes from toolbox.config, every caller shares that single Gemini client
 #To avoid high demand of requesting and occur 503 error
-def safe_generate_content(model_id, contents, config=None):
+def _call_with_backoff(request_fn):
     """
-    Call Gemini API with exponential backoff to handle 503/429 errors.
+    Runs a Gemini request with exponential backoff to handle 503/429 errors.
     """
     max_retries = 5
     base_delay = 10  # Initial wait time in seconds
     
     for attempt in range(max_retries):
         try:
-            return client.models.generate_content(
-                model=model_id,
-                contents=contents,
-                config=config
-            )
+            return request_fn()
         except Exception as e:
             # Check if error is related to server busy (503) or rate limit (429)
             if "503" in str(e) or "429" in str(e):
@@ -80,4 +75,33 @@ def safe_generate_content(model_id, contents, config=None):
                 print(f"❌ Critical API Error: {e}")
                 raise e
                 
-    raise Exception("❌ Max retries exceeded. Google server is still unavailable.")
\ No newline at end of file
+    raise Exception("❌ Max retries exceeded. Google server is still unavailable.")
+
+def safe_generate_content(model_id, contents, config=None):
+    """
+    Call Gemini API with exponential backoff to handle 503/429 errors.
+    """
+    return _call_with_backoff(lambda: client.models.generate_content(
+        model=model_id,
+        contents=contents,
+        config=config
+    ))
+
+def safe_generate_text_stream(model_id, contents, config=None) -> str:
+    """
+    Streaming variant of safe_generate_content: chunks are collected while the
+    rest of the response is still in flight, and the joined text is returned.
+    A failed stream is restarted from scratch by the backoff loop.
+    """
+    def consume_stream():
+        parts = []
+        for chunk in client.models.generate_content_stream(
+            model=model_id,
+            contents=contents,
+            config=config
+        ):
+            if chunk.text:
+                parts.append(chunk.text)
+        return "".join(parts)
+
+    return _call_with_backoff(consume_stream)